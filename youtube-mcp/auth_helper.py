@@ -56,6 +56,7 @@ def cmd_token(redirect_url):
         "client_id": creds.client_id,
         "client_secret": creds.client_secret,
         "scopes": list(creds.scopes) if creds.scopes else SCOPES,
+        "expiry": creds.expiry.isoformat() if creds.expiry else None,
     }
     with open(TOKEN_FILE, "w") as f:
         json.dump(token_data, f, indent=2)
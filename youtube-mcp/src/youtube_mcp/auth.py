@@ -1,7 +1,10 @@
 """OAuth 2.0 authentication for YouTube API."""
 
+import hashlib
 import json
 import os
+import threading
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -42,6 +45,7 @@ class YouTubeAuth:
         self.client_secret_path = client_secret_path or DEFAULT_CLIENT_SECRET
         self.token_path = token_path or DEFAULT_TOKEN_FILE
         self._credentials: Optional[Credentials] = None
+        self._refresh_lock = threading.Lock()
 
     def get_credentials(self) -> Credentials:
         """Get valid credentials, refreshing or re-authenticating if necessary.
@@ -66,8 +70,7 @@ class YouTubeAuth:
             # Try to refresh expired credentials
             if self._credentials and self._credentials.expired and self._credentials.refresh_token:
                 try:
-                    self._credentials.refresh(Request())
-                    self._save_token(self._credentials)
+                    self._refresh(self._credentials)
                     if self._has_required_scopes(self._credentials):
                         return self._credentials
                     # Token refreshed but missing scopes, need re-auth
@@ -79,6 +82,60 @@ class YouTubeAuth:
         self._credentials = self._authenticate()
         return self._credentials
 
+    def _refresh(self, credentials: Credentials) -> None:
+        """Refresh an access token and persist it.
+
+        Serialized so that concurrent callers do not each hit the token
+        endpoint; callers that waited find the token already fresh.
+        """
+        with self._refresh_lock:
+            if credentials.valid and credentials.expiry is not None:
+                return
+            credentials.refresh(Request())
+            self._save_token(credentials)
+
+    def refresh_if_expiring(self, margin: float = 300.0) -> Optional[datetime]:
+        """Refresh the stored access token ahead of its expiry.
+
+        Only uses an existing token file; never starts an OAuth flow.
+
+        Args:
+            margin: Refresh when the token expires within this many seconds
+
+        Returns:
+            Expiry (naive UTC) of the current access token, or None if there
+            is no refreshable token
+        """
+        credentials = self._credentials or self._load_token()
+        if credentials is None or not credentials.refresh_token:
+            return None
+        self._credentials = credentials
+
+        expiry = credentials.expiry
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if expiry is None or (expiry - now).total_seconds() < margin:
+            with self._refresh_lock:
+                if credentials.expiry == expiry:
+                    credentials.refresh(Request())
+                    self._save_token(credentials)
+        return credentials.expiry
+
+    def cache_namespace(self) -> str:
+        """Get an opaque identifier of the authorized account for keying caches.
+
+        Derived from the stored refresh token, so it changes on re-authentication
+        and does not reveal the token itself. Never triggers a refresh or an
+        OAuth flow.
+
+        Returns:
+            Hex digest identifying the current authorization
+        """
+        credentials = self._credentials or self._load_token()
+        secret = ""
+        if credentials is not None:
+            secret = credentials.refresh_token or credentials.token or ""
+        return hashlib.sha256(secret.encode()).hexdigest()[:32]
+
     def _has_required_scopes(self, credentials: Credentials) -> bool:
         """Check if credentials have all required scopes.
 
@@ -182,6 +239,7 @@ class YouTubeAuth:
         try:
             with open(self.token_path, "r") as f:
                 token_data = json.load(f)
+            expiry = token_data.get("expiry")
 
             return Credentials(
                 token=token_data.get("token"),
@@ -190,8 +248,9 @@ class YouTubeAuth:
                 client_id=token_data.get("client_id"),
                 client_secret=token_data.get("client_secret"),
                 scopes=token_data.get("scopes"),
+                expiry=datetime.fromisoformat(expiry) if expiry else None,
             )
-        except (json.JSONDecodeError, KeyError, FileNotFoundError):
+        except (json.JSONDecodeError, KeyError, ValueError, FileNotFoundError):
             return None
 
     def _save_token(self, credentials: Credentials) -> None:
@@ -210,6 +269,7 @@ class YouTubeAuth:
             "client_id": credentials.client_id,
             "client_secret": credentials.client_secret,
             "scopes": credentials.scopes,
+            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
         }
 
         with open(self.token_path, "w") as f:
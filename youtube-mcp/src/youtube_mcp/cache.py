@@ -0,0 +1,162 @@
+"""TTL caching for read-only YouTube API results."""
+
+import json
+import sqlite3
+import threading
+import time
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+# Sentinel returned by TTLCache.get() on a miss
+MISSING = object()
+
+# Directory of the persistent caches ($XDG_CACHE_HOME/youtube-mcp)
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "youtube-mcp"
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a time-to-live.
+
+    Thread-safe, so it can be shared between the event loop and worker threads.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (least recently used are evicted)
+            ttl: Default time-to-live of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally overriding the default time-to-live."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            count = len(self._data)
+            self._data.clear()
+            return count
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SQLiteCache:
+    """Persistent cache of JSON-serializable values with per-entry expiry.
+
+    Backed by a single sqlite file so cached results survive server restarts.
+    Thread-safe; expiry uses wall-clock time since entries outlive the process.
+    """
+
+    def __init__(self, path: Path, maxsize: int = 10_000):
+        """Open (creating if needed) the cache database.
+
+        Args:
+            path: Path of the sqlite database file
+            maxsize: Maximum number of entries kept (soonest to expire are evicted)
+
+        Raises:
+            OSError: If the cache directory cannot be created
+            sqlite3.Error: If the database cannot be opened
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.maxsize = maxsize
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+    def get(self, key: str, default: Any = MISSING) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable value for ttl seconds."""
+        data = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, expires_at, value) VALUES (?, ?, ?)",
+                (key, time.time() + ttl, data),
+            )
+            self._writes += 1
+            if self._writes % 100 == 0:
+                self._prune()
+
+    def _prune(self) -> None:
+        """Drop expired entries, then the soonest-expiring ones beyond maxsize."""
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        self._conn.execute(
+            "DELETE FROM cache WHERE key IN ("
+            "SELECT key FROM cache ORDER BY expires_at "
+            "LIMIT max(0, (SELECT count(*) FROM cache) - ?))",
+            (self.maxsize,),
+        )
+
+    def clear(self) -> int:
+        """Remove all entries.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._conn.execute("DELETE FROM cache").rowcount
+
+    def clear_prefix(self, prefix: str) -> int:
+        """Remove all entries whose key starts with prefix.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            # A key range rather than LIKE, so the primary key index is used
+            return self._conn.execute(
+                "DELETE FROM cache WHERE key >= ? AND key < ?", (prefix, prefix + "\U0010ffff")
+            ).rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT count(*) FROM cache WHERE expires_at > ?", (time.time(),)
+            ).fetchone()[0]
@@ -0,0 +1,244 @@
+"""Client-side pacing of YouTube Data API quota usage."""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from typing import Optional
+
+# Default daily quota of a Google Cloud project for the YouTube Data API
+DEFAULT_DAILY_QUOTA = 10_000
+# Units kept for uploads and writes once reads have spent the rest; enough
+# for one video upload plus its thumbnail and a few edits
+DEFAULT_WRITE_RESERVE = 2_000
+
+# Approximate Data API units spent per tool call (videos.insert = 1600,
+# search.list = 100, captions.insert = 400, other writes = 50, reads = 1).
+# Multi-request tools count each request. YouTube Analytics API queries do not
+# draw from this quota, so analytics tools only pay for their title lookups.
+TOOL_COST = {
+    # Upload tools
+    "youtube_upload_video": 1600,
+    "youtube_set_thumbnail": 50,
+    # Management tools
+    "youtube_update_video": 51,
+    "youtube_set_video_localization": 51,
+    "youtube_delete_video": 50,
+    # Analytics tools
+    "youtube_video_analytics": 0,
+    "youtube_videos_analytics": 0,
+    "youtube_audience_retention": 0,
+    "youtube_traffic_sources": 0,
+    "youtube_demographics": 0,
+    "youtube_revenue_report": 0,
+    "youtube_device_analytics": 0,
+    "youtube_playback_locations": 0,
+    "youtube_video_bundle": 0,
+    # Comments tools
+    "youtube_reply_to_comment": 50,
+    "youtube_post_comment": 50,
+    "youtube_moderate_comment": 50,
+    "youtube_moderate_comments": 50,
+    # Playlist tools
+    "youtube_create_playlist": 50,
+    "youtube_update_playlist": 50,
+    "youtube_delete_playlist": 50,
+    "youtube_add_to_playlist": 50,
+    "youtube_remove_from_playlist": 50,
+    "youtube_remove_from_playlist_bulk": 50,
+    # Caption tools
+    "youtube_upload_caption": 400,
+    "youtube_update_caption": 450,
+    "youtube_download_caption": 200,
+    "youtube_delete_caption": 50,
+    # Search tools
+    "youtube_search": 100,
+}
+DEFAULT_COST = 1
+
+# Tools that page through results past the first API page, with the page size
+# of their list call; each page is charged the tool's cost
+PAGED_TOOL_PAGE_SIZE = {
+    "youtube_list_comments": 100,
+    "youtube_list_playlist_items": 50,
+}
+
+# Tools acting on a list of IDs, with the argument holding the list and the
+# number of IDs one API request takes; each request is charged the tool's cost
+BULK_TOOL_IDS = {
+    "youtube_moderate_comments": ("comment_ids", 50),
+    "youtube_remove_from_playlist_bulk": ("playlist_item_ids", 1),
+}
+
+# Order in which waiting calls are served when quota runs short (lower first).
+# Losing an upload or a moderation action is worse than delaying a read, and
+# search is the most expensive read.
+PRIORITY_UPLOAD = 0
+PRIORITY_WRITE = 1
+PRIORITY_READ = 2
+PRIORITY_SEARCH = 3
+
+TOOL_PRIORITY = {
+    # Upload tools
+    "youtube_upload_video": PRIORITY_UPLOAD,
+    "youtube_set_thumbnail": PRIORITY_UPLOAD,
+    "youtube_upload_caption": PRIORITY_UPLOAD,
+    # Management tools
+    "youtube_update_video": PRIORITY_WRITE,
+    "youtube_set_video_localization": PRIORITY_WRITE,
+    "youtube_delete_video": PRIORITY_WRITE,
+    # Comments tools
+    "youtube_reply_to_comment": PRIORITY_WRITE,
+    "youtube_post_comment": PRIORITY_WRITE,
+    "youtube_moderate_comment": PRIORITY_WRITE,
+    "youtube_moderate_comments": PRIORITY_WRITE,
+    # Playlist tools
+    "youtube_create_playlist": PRIORITY_WRITE,
+    "youtube_update_playlist": PRIORITY_WRITE,
+    "youtube_delete_playlist": PRIORITY_WRITE,
+    "youtube_add_to_playlist": PRIORITY_WRITE,
+    "youtube_remove_from_playlist": PRIORITY_WRITE,
+    "youtube_remove_from_playlist_bulk": PRIORITY_WRITE,
+    # Caption tools
+    "youtube_update_caption": PRIORITY_WRITE,
+    "youtube_delete_caption": PRIORITY_WRITE,
+    # Search tools
+    "youtube_search": PRIORITY_SEARCH,
+}
+
+
+def call_cost(name: str, arguments: dict) -> int:
+    """Return the units a tool call is expected to spend."""
+    cost = TOOL_COST.get(name, DEFAULT_COST)
+    page_size = PAGED_TOOL_PAGE_SIZE.get(name)
+    if page_size is not None:
+        cost *= -(-arguments.get("max_results", 1) // page_size)
+    bulk = BULK_TOOL_IDS.get(name)
+    if bulk is not None:
+        list_key, ids_per_request = bulk
+        cost *= max(1, -(-len(arguments.get(list_key, ())) // ids_per_request))
+    return cost
+
+
+class QuotaExceededError(Exception):
+    """Raised when a call cannot be paid for within the allowed wait."""
+
+
+class QuotaReservedError(QuotaExceededError):
+    """Raised when a read is refused because the remaining quota is kept for writes."""
+
+
+class AsyncTokenBucket:
+    """Token bucket that paces quota spending across concurrent tool calls.
+
+    The bucket starts full and refills continuously so that a whole day's
+    quota is restored over 24 hours. Waiting callers are served by priority,
+    then in arrival order, so a large request is not starved by a stream of
+    cheap ones. Once the balance falls to the write reserve, reads are refused
+    outright rather than queued.
+    """
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_rate: float,
+        reserve: float = 0.0,
+        write_reserve: float = 0.0,
+    ):
+        """Initialize the bucket.
+
+        Args:
+            capacity: Maximum number of units held
+            refill_rate: Units restored per second
+            reserve: Units that are never spent, left for other clients sharing
+                the same project
+            write_reserve: Units above reserve that only uploads and writes
+                may spend
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.reserve = reserve
+        self.write_reserve = write_reserve
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._waiters: list[tuple[int, int]] = []
+        self._arrivals = itertools.count()
+        self._condition = asyncio.Condition()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+    async def acquire(
+        self,
+        cost: float,
+        priority: int = PRIORITY_READ,
+        max_wait: Optional[float] = None,
+    ) -> None:
+        """Take cost units, waiting for the bucket to refill if necessary.
+
+        Args:
+            cost: Units to spend
+            priority: Service order among waiting calls (PRIORITY_* constant)
+            max_wait: Longest acceptable wait in seconds (None waits indefinitely)
+
+        Raises:
+            QuotaReservedError: If a read would dip into the write reserve
+            QuotaExceededError: If the units cannot be available within max_wait
+        """
+        if cost <= 0:
+            return
+        if cost > self.capacity - self.reserve:
+            raise QuotaExceededError(
+                f"Call costs {cost} units but only {self.capacity - self.reserve:g} "
+                "are usable per day"
+            )
+
+        floor = self.reserve
+        if priority >= PRIORITY_READ:
+            floor += self.write_reserve
+        self._refill()
+        if priority >= PRIORITY_READ and self.write_reserve and self.tokens - cost < floor:
+            raise QuotaReservedError(
+                f"Remaining API quota ({self.tokens:.0f} units) is reserved for uploads and writes"
+            )
+        wait = (cost + floor - self.tokens) / self.refill_rate
+        if max_wait is not None and wait > max_wait:
+            raise QuotaExceededError(
+                f"Daily API quota is nearly used up; {cost} units will be "
+                f"available in about {wait / 60:.0f} minutes"
+            )
+
+        entry = (priority, next(self._arrivals))
+        async with self._condition:
+            heapq.heappush(self._waiters, entry)
+            # A new waiter may now be first in line; let the current head re-check
+            self._condition.notify_all()
+            try:
+                while True:
+                    self._refill()
+                    if self._waiters[0] == entry:
+                        wait = (cost + floor - self.tokens) / self.refill_rate
+                        if wait <= 0:
+                            break
+                    else:
+                        wait = None
+                    try:
+                        await asyncio.wait_for(self._condition.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                self.tokens -= cost
+            finally:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._condition.notify_all()
+
+
+def bucket_from_env() -> AsyncTokenBucket:
+    """Create the bucket configured by the YOUTUBE_* quota environment variables."""
+    daily_quota = float(os.environ.get("YOUTUBE_DAILY_QUOTA", DEFAULT_DAILY_QUOTA))
+    reserve = float(os.environ.get("YOUTUBE_RESERVE", 0))
+    write_reserve = float(os.environ.get("YOUTUBE_WRITE_RESERVE", DEFAULT_WRITE_RESERVE))
+    return AsyncTokenBucket(daily_quota, daily_quota / 86_400, reserve, write_reserve)
@@ -1,8 +1,9 @@
 """Pydantic schemas for YouTube MCP Server."""
 
 from enum import Enum
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
+from typing_extensions import Annotated, NotRequired, TypedDict
 
 
 class PrivacyStatus(str, Enum):
@@ -246,3 +247,259 @@ class ContentPerformance(BaseModel):
     comments: int
     shares: int
     subscribers_gained: int
+
+
+class ContentPerformanceColumns(BaseModel):
+    """Content performance analytics as parallel per-metric columns.
+
+    Entry i of every list belongs to video_ids[i]. Avoids repeating every key
+    for each video in large reports.
+    """
+    video_ids: list[str] = []
+    titles: list[str] = []
+    views: list[int] = []
+    estimated_minutes_watched: list[float] = []
+    average_view_duration: list[float] = []
+    likes: list[int] = []
+    comments: list[int] = []
+    shares: list[int] = []
+    subscribers_gained: list[int] = []
+
+
+class VideoBundle(BaseModel):
+    """The main analytics reports of one video, fetched together."""
+    video_id: str
+    analytics: VideoAnalytics
+    retention: AudienceRetention
+    traffic_sources: list[TrafficSource]
+    devices: list[DeviceStats]
+
+
+# Tool argument schemas (validated once per call by a cached TypeAdapter).
+# Enums and bounds mirror the tools' JSON input schemas, so bad arguments are
+# rejected before any API request is made.
+PrivacyArg = Literal["public", "private", "unlisted"]
+PageSize = Annotated[int, Field(ge=1, le=50)]
+
+
+class CacheableArgs(TypedDict):
+    """Cache bypass flag shared by read-only tools."""
+    no_cache: NotRequired[bool]
+
+
+class FieldsProjectionArgs(CacheableArgs):
+    """Optional output projection shared by tools that return lists."""
+    fields: NotRequired[Optional[list[str]]]
+
+
+class UploadVideoArgs(TypedDict):
+    file_path: str
+    title: str
+    description: NotRequired[str]
+    tags: NotRequired[list[str]]
+    privacy: NotRequired[PrivacyArg]
+    category_id: NotRequired[str]
+    thumbnail_path: NotRequired[Optional[str]]
+    chunk_size_mib: NotRequired[Annotated[int, Field(ge=1, le=256)]]
+
+
+class SetThumbnailArgs(TypedDict):
+    video_id: str
+    thumbnail_path: str
+    reencode: NotRequired[bool]
+
+
+class VideoIdArgs(CacheableArgs):
+    video_id: str
+
+
+class DeleteVideoArgs(TypedDict):
+    video_id: str
+
+
+class VideoIdsArgs(FieldsProjectionArgs):
+    video_ids: list[str]
+
+
+class ListVideosArgs(FieldsProjectionArgs):
+    max_results: NotRequired[PageSize]
+    order: NotRequired[Literal["date", "rating", "viewCount", "title"]]
+
+
+class UpdateVideoArgs(TypedDict):
+    video_id: str
+    title: NotRequired[Optional[str]]
+    description: NotRequired[Optional[str]]
+    tags: NotRequired[Optional[list[str]]]
+    privacy: NotRequired[Optional[PrivacyArg]]
+    category_id: NotRequired[Optional[str]]
+
+
+class UpdateVideosArgs(TypedDict):
+    updates: list[UpdateVideoArgs]
+
+
+class SetVideoLocalizationArgs(TypedDict):
+    video_id: str
+    language: str
+    localized_title: str
+    localized_description: str
+
+
+class NoArgs(TypedDict):
+    pass
+
+
+class ChannelStatsArgs(CacheableArgs):
+    pass
+
+
+class VideoDateRangeArgs(CacheableArgs):
+    video_id: str
+    start_date: NotRequired[Optional[str]]
+    end_date: NotRequired[Optional[str]]
+
+
+class VideoIdsDateRangeArgs(FieldsProjectionArgs):
+    video_ids: list[str]
+    start_date: NotRequired[Optional[str]]
+    end_date: NotRequired[Optional[str]]
+
+
+class OptionalVideoDateRangeArgs(FieldsProjectionArgs):
+    video_id: NotRequired[Optional[str]]
+    start_date: NotRequired[Optional[str]]
+    end_date: NotRequired[Optional[str]]
+
+
+class DateRangeArgs(CacheableArgs):
+    start_date: NotRequired[Optional[str]]
+    end_date: NotRequired[Optional[str]]
+
+
+class TopVideosArgs(FieldsProjectionArgs):
+    metric: NotRequired[Literal["views", "watchTime", "likes", "comments"]]
+    period_days: NotRequired[int]
+    limit: NotRequired[int]
+
+
+class ContentPerformanceArgs(FieldsProjectionArgs):
+    start_date: NotRequired[Optional[str]]
+    end_date: NotRequired[Optional[str]]
+    max_results: NotRequired[PageSize]
+    columnar: NotRequired[bool]
+
+
+class ListCommentsArgs(FieldsProjectionArgs):
+    video_id: str
+    max_results: NotRequired[Annotated[int, Field(ge=1, le=500)]]
+    order: NotRequired[Literal["time", "relevance"]]
+
+
+class ReplyToCommentArgs(TypedDict):
+    comment_id: str
+    text: str
+
+
+class CommentRepliesArgs(CacheableArgs):
+    comment_id: str
+    max_results: NotRequired[int]
+
+
+class PostCommentArgs(TypedDict):
+    video_id: str
+    text: str
+
+
+class ModerateCommentArgs(TypedDict):
+    comment_id: str
+    moderation_status: NotRequired[Literal["published", "heldForReview", "rejected"]]
+    ban_author: NotRequired[bool]
+
+
+class ModerateCommentsArgs(TypedDict):
+    comment_ids: list[str]
+    moderation_status: NotRequired[Literal["published", "heldForReview", "rejected"]]
+    ban_author: NotRequired[bool]
+
+
+class ListHeldCommentsArgs(CacheableArgs):
+    video_id: NotRequired[Optional[str]]
+    max_results: NotRequired[int]
+
+
+class ListPlaylistsArgs(CacheableArgs):
+    max_results: NotRequired[PageSize]
+
+
+class CreatePlaylistArgs(TypedDict):
+    title: str
+    description: NotRequired[str]
+    privacy: NotRequired[PrivacyArg]
+
+
+class UpdatePlaylistArgs(TypedDict):
+    playlist_id: str
+    title: NotRequired[Optional[str]]
+    description: NotRequired[Optional[str]]
+    privacy: NotRequired[Optional[PrivacyArg]]
+
+
+class PlaylistIdArgs(TypedDict):
+    playlist_id: str
+
+
+class ListPlaylistItemsArgs(FieldsProjectionArgs):
+    playlist_id: str
+    max_results: NotRequired[Annotated[int, Field(ge=1, le=500)]]
+
+
+class AddToPlaylistArgs(TypedDict):
+    playlist_id: str
+    video_id: str
+    position: NotRequired[Optional[int]]
+
+
+class RemoveFromPlaylistArgs(TypedDict):
+    playlist_item_id: str
+
+
+class RemoveFromPlaylistBulkArgs(TypedDict):
+    playlist_item_ids: list[str]
+
+
+class UploadCaptionArgs(TypedDict):
+    video_id: str
+    language: str
+    name: NotRequired[str]
+    body: NotRequired[str]
+    file_path: NotRequired[Optional[str]]
+    is_draft: NotRequired[bool]
+
+
+class UpdateCaptionArgs(TypedDict):
+    caption_id: str
+    video_id: NotRequired[str]
+    name: NotRequired[Optional[str]]
+    is_draft: NotRequired[Optional[bool]]
+    body: NotRequired[Optional[str]]
+    file_path: NotRequired[Optional[str]]
+
+
+class DownloadCaptionArgs(CacheableArgs):
+    caption_id: str
+    fmt: NotRequired[Literal["srt", "sbv", "vtt"]]
+
+
+class CaptionIdArgs(TypedDict):
+    caption_id: str
+
+
+class SearchArgs(CacheableArgs):
+    query: str
+    type: NotRequired[Literal["video", "channel", "playlist"]]
+    max_results: NotRequired[PageSize]
+    order: NotRequired[Literal["relevance", "date", "viewCount", "rating"]]
+    channel_id: NotRequired[Optional[str]]
+    published_after: NotRequired[Optional[str]]
+    published_before: NotRequired[Optional[str]]
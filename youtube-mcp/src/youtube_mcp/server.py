@@ -1,1105 +1,1627 @@
 """YouTube MCP Server - Main entry point."""
 
+import asyncio
+import functools
+import hashlib
+import importlib
 import json
 import logging
-from typing import Any
+import random
+import sqlite3
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from types import MappingProxyType, ModuleType
+from typing import Any, Optional
 
+from googleapiclient.errors import HttpError
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
 
-from .tools import upload, manage, analytics, comments, playlists, captions, search
+from . import schemas
+from .cache import CACHE_DIR, MISSING, SQLiteCache, TTLCache
+from .quota import (
+    PRIORITY_READ,
+    TOOL_PRIORITY,
+    QuotaExceededError,
+    bucket_from_env,
+    call_cost,
+)
+
+# orjson (optional, see the "speedups" extra) serializes large results several
+# times faster than the json module; fall back to json when missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+# stdout carries the MCP stdio stream, so logs must go to stderr
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    stream=sys.stderr,
+)
 logger = logging.getLogger(__name__)
 
 # Create MCP server
 server = Server("youtube-mcp")
 
+# Tool submodules, imported on first use. Loading every module (and the Google
+# API client stack behind it) at start-up dominates cold-start time even though
+# most sessions only touch a handful of tools.
+_MODULES = {
+    "upload": "youtube_mcp.tools.upload",
+    "manage": "youtube_mcp.tools.manage",
+    "analytics": "youtube_mcp.tools.analytics",
+    "comments": "youtube_mcp.tools.comments",
+    "playlists": "youtube_mcp.tools.playlists",
+    "captions": "youtube_mcp.tools.captions",
+    "search": "youtube_mcp.tools.search",
+}
+_loaded_modules: dict[str, ModuleType] = {}
+
+
+def _mod(name: str) -> ModuleType:
+    """Return a tool submodule, importing it on first use."""
+    module = _loaded_modules.get(name)
+    if module is None:
+        module = _loaded_modules[name] = importlib.import_module(_MODULES[name])
+    return module
+
+
+# Argument schema for each tool. The TypeAdapters are built once at import and
+# reused, so each call is validated in a single pydantic-core pass.
+_ARGUMENT_SCHEMAS = {
+    # Upload tools
+    "youtube_upload_video": schemas.UploadVideoArgs,
+    "youtube_set_thumbnail": schemas.SetThumbnailArgs,
+    # Management tools
+    "youtube_get_video": schemas.VideoIdArgs,
+    "youtube_get_videos_batch": schemas.VideoIdsArgs,
+    "youtube_list_videos": schemas.ListVideosArgs,
+    "youtube_update_video": schemas.UpdateVideoArgs,
+    "youtube_update_videos": schemas.UpdateVideosArgs,
+    "youtube_set_video_localization": schemas.SetVideoLocalizationArgs,
+    "youtube_delete_video": schemas.DeleteVideoArgs,
+    # Analytics tools
+    "youtube_channel_stats": schemas.ChannelStatsArgs,
+    "youtube_video_analytics": schemas.VideoDateRangeArgs,
+    "youtube_videos_analytics": schemas.VideoIdsDateRangeArgs,
+    "youtube_audience_retention": schemas.VideoDateRangeArgs,
+    "youtube_traffic_sources": schemas.OptionalVideoDateRangeArgs,
+    "youtube_demographics": schemas.DateRangeArgs,
+    "youtube_top_videos": schemas.TopVideosArgs,
+    "youtube_revenue_report": schemas.DateRangeArgs,
+    # Comments tools
+    "youtube_list_comments": schemas.ListCommentsArgs,
+    "youtube_reply_to_comment": schemas.ReplyToCommentArgs,
+    "youtube_get_comment_replies": schemas.CommentRepliesArgs,
+    "youtube_post_comment": schemas.PostCommentArgs,
+    "youtube_moderate_comment": schemas.ModerateCommentArgs,
+    "youtube_moderate_comments": schemas.ModerateCommentsArgs,
+    "youtube_list_held_comments": schemas.ListHeldCommentsArgs,
+    # Playlist tools
+    "youtube_list_playlists": schemas.ListPlaylistsArgs,
+    "youtube_create_playlist": schemas.CreatePlaylistArgs,
+    "youtube_update_playlist": schemas.UpdatePlaylistArgs,
+    "youtube_delete_playlist": schemas.PlaylistIdArgs,
+    "youtube_list_playlist_items": schemas.ListPlaylistItemsArgs,
+    "youtube_add_to_playlist": schemas.AddToPlaylistArgs,
+    "youtube_remove_from_playlist": schemas.RemoveFromPlaylistArgs,
+    "youtube_remove_from_playlist_bulk": schemas.RemoveFromPlaylistBulkArgs,
+    # Caption tools
+    "youtube_list_captions": schemas.VideoIdArgs,
+    "youtube_upload_caption": schemas.UploadCaptionArgs,
+    "youtube_update_caption": schemas.UpdateCaptionArgs,
+    "youtube_download_caption": schemas.DownloadCaptionArgs,
+    "youtube_delete_caption": schemas.CaptionIdArgs,
+    # Search tools
+    "youtube_search": schemas.SearchArgs,
+    # Extended analytics tools
+    "youtube_device_analytics": schemas.OptionalVideoDateRangeArgs,
+    "youtube_playback_locations": schemas.OptionalVideoDateRangeArgs,
+    "youtube_content_performance": schemas.ContentPerformanceArgs,
+    "youtube_video_bundle": schemas.VideoDateRangeArgs,
+    # Cache tools
+    "youtube_cache_clear": schemas.NoArgs,
+    "youtube_cache_stats": schemas.NoArgs,
+}
+_VALIDATORS = {name: TypeAdapter(args) for name, args in _ARGUMENT_SCHEMAS.items()}
+
+# Tool name -> (tool submodule, function). Validated arguments are passed
+# straight through as keyword arguments, so omitted ones take the function's
+# own defaults.
+_DISPATCH = {
+    # Upload tools
+    "youtube_upload_video": ("upload", "upload_video"),
+    "youtube_set_thumbnail": ("upload", "set_thumbnail"),
+    # Management tools
+    "youtube_get_video": ("manage", "get_video"),
+    "youtube_get_videos_batch": ("manage", "get_videos"),
+    "youtube_list_videos": ("manage", "list_videos"),
+    "youtube_update_video": ("manage", "update_video"),
+    "youtube_set_video_localization": ("manage", "set_video_localization"),
+    "youtube_delete_video": ("manage", "delete_video"),
+    # Analytics tools
+    "youtube_channel_stats": ("analytics", "get_channel_stats"),
+    "youtube_video_analytics": ("analytics", "get_video_analytics"),
+    "youtube_videos_analytics": ("analytics", "get_videos_analytics"),
+    "youtube_audience_retention": ("analytics", "get_audience_retention"),
+    "youtube_traffic_sources": ("analytics", "get_traffic_sources"),
+    "youtube_demographics": ("analytics", "get_demographics"),
+    "youtube_top_videos": ("analytics", "get_top_videos"),
+    "youtube_revenue_report": ("analytics", "get_revenue_report"),
+    # Comments tools
+    "youtube_list_comments": ("comments", "list_comments"),
+    "youtube_reply_to_comment": ("comments", "reply_to_comment"),
+    "youtube_get_comment_replies": ("comments", "get_comment_replies"),
+    "youtube_post_comment": ("comments", "post_comment"),
+    "youtube_moderate_comment": ("comments", "moderate_comment"),
+    "youtube_moderate_comments": ("comments", "moderate_comments"),
+    "youtube_list_held_comments": ("comments", "list_held_comments"),
+    # Playlist tools
+    "youtube_list_playlists": ("playlists", "list_playlists"),
+    "youtube_create_playlist": ("playlists", "create_playlist"),
+    "youtube_update_playlist": ("playlists", "update_playlist"),
+    "youtube_delete_playlist": ("playlists", "delete_playlist"),
+    "youtube_list_playlist_items": ("playlists", "list_playlist_items"),
+    "youtube_add_to_playlist": ("playlists", "add_to_playlist"),
+    "youtube_remove_from_playlist": ("playlists", "remove_from_playlist"),
+    "youtube_remove_from_playlist_bulk": ("playlists", "remove_from_playlist_bulk"),
+    # Caption tools
+    "youtube_list_captions": ("captions", "list_captions"),
+    "youtube_upload_caption": ("captions", "upload_caption"),
+    "youtube_update_caption": ("captions", "update_caption"),
+    "youtube_download_caption": ("captions", "download_caption"),
+    "youtube_delete_caption": ("captions", "delete_caption"),
+    # Search tools
+    "youtube_search": ("search", "search"),
+    # Extended analytics tools
+    "youtube_device_analytics": ("analytics", "get_device_analytics"),
+    "youtube_playback_locations": ("analytics", "get_playback_locations"),
+    "youtube_content_performance": ("analytics", "get_content_performance"),
+    "youtube_video_bundle": ("analytics", "get_video_bundle"),
+}
+
+# Plural tools: list argument -> single tool run once per item. The items are
+# independent requests, so they are dispatched concurrently on worker threads.
+_FAN_OUT = {
+    "youtube_update_videos": ("updates", "youtube_update_video"),
+}
+# Concurrent requests per fan-out call, kept under the Data API's default
+# per-user rate limit
+_FAN_OUT_CONCURRENCY = 8
+
+# Worker threads for the blocking googleapiclient calls. File uploads stream
+# for minutes, so they run on a small pool of their own and cannot occupy every
+# worker that read requests need.
+_API_WORKERS = 16
+_upload_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yt-upload")
+_UPLOAD_TOOLS = frozenset({"youtube_upload_video", "youtube_upload_caption"})
+
+# Retry policy for transient API errors: exponential backoff with jitter,
+# honouring Retry-After when the server sends it. 403 is retried only for
+# per-user rate limits; an exhausted daily quota does not recover in seconds.
+_RETRY_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 32.0
+_RETRIABLE_STATUSES = frozenset({429, 500, 503})
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+# Client-side quota pacing. Calls wait for the bucket to refill rather than
+# running into quotaExceeded, but give up instead of waiting longer than this.
+_quota = bucket_from_env()
+_QUOTA_MAX_WAIT = 300.0
+
+# Tools that create something. A 5xx may arrive after the write succeeded, so
+# these are retried only when the request was rejected by rate limiting.
+_NON_IDEMPOTENT = frozenset({
+    "youtube_upload_video",
+    "youtube_reply_to_comment",
+    "youtube_post_comment",
+    "youtube_create_playlist",
+    "youtube_add_to_playlist",
+    "youtube_upload_caption",
+})
+
+# Schema keys that differ from the handler's parameter names
+_ARGUMENT_RENAMES = {
+    "youtube_search": {"type": "result_type"},
+}
+
+# Read-only tools whose results are cached in-process, with their TTL in
+# seconds. Repeated identical queries within the window are answered from
+# memory instead of spending API quota. Channel-level aggregates change slowly;
+# comments are the most volatile.
+_CACHE_TTL = {
+    # Management tools
+    "youtube_get_video": 300,
+    "youtube_get_videos_batch": 300,
+    "youtube_list_videos": 300,
+    # Analytics tools
+    "youtube_channel_stats": 3600,
+    "youtube_video_analytics": 600,
+    "youtube_videos_analytics": 600,
+    "youtube_audience_retention": 600,
+    "youtube_traffic_sources": 600,
+    "youtube_demographics": 3600,
+    "youtube_top_videos": 600,
+    "youtube_revenue_report": 3600,
+    "youtube_device_analytics": 600,
+    "youtube_playback_locations": 600,
+    "youtube_content_performance": 600,
+    "youtube_video_bundle": 600,
+    # Comments tools
+    "youtube_list_comments": 60,
+    "youtube_get_comment_replies": 60,
+    "youtube_list_held_comments": 60,
+    # Playlist tools
+    "youtube_list_playlists": 300,
+    "youtube_list_playlist_items": 300,
+    # Caption tools
+    "youtube_list_captions": 300,
+    "youtube_download_caption": 300,
+    # Search tools
+    "youtube_search": 300,
+}
+# Cached tools whose results a successful write makes stale. Their caches are
+# dropped (in memory and on disk) once the write completes, so a read right
+# after an edit does not return the old state.
+_VIDEO_READS = (
+    "youtube_get_video",
+    "youtube_get_videos_batch",
+    "youtube_list_videos",
+    "youtube_search",
+)
+_COMMENT_READS = (
+    "youtube_list_comments",
+    "youtube_get_comment_replies",
+    "youtube_list_held_comments",
+)
+_PLAYLIST_READS = ("youtube_list_playlists", "youtube_list_playlist_items")
+_CAPTION_READS = ("youtube_list_captions", "youtube_download_caption")
+_INVALIDATES = {
+    # Upload tools
+    "youtube_upload_video": _VIDEO_READS,
+    "youtube_set_thumbnail": _VIDEO_READS,
+    # Management tools
+    "youtube_update_video": _VIDEO_READS,
+    "youtube_set_video_localization": _VIDEO_READS,
+    "youtube_delete_video": _VIDEO_READS,
+    # Comments tools
+    "youtube_reply_to_comment": _COMMENT_READS,
+    "youtube_post_comment": _COMMENT_READS,
+    "youtube_moderate_comment": _COMMENT_READS,
+    "youtube_moderate_comments": _COMMENT_READS,
+    # Playlist tools
+    "youtube_create_playlist": _PLAYLIST_READS,
+    "youtube_update_playlist": _PLAYLIST_READS,
+    "youtube_delete_playlist": _PLAYLIST_READS,
+    "youtube_add_to_playlist": _PLAYLIST_READS,
+    "youtube_remove_from_playlist": _PLAYLIST_READS,
+    "youtube_remove_from_playlist_bulk": _PLAYLIST_READS,
+    # Caption tools
+    "youtube_upload_caption": _CAPTION_READS,
+    "youtube_update_caption": _CAPTION_READS,
+    "youtube_delete_caption": _CAPTION_READS,
+}
+
+# One cache per tool so TTLs can be tuned per category
+_caches = {name: TTLCache(maxsize=512, ttl=ttl) for name, ttl in _CACHE_TTL.items()}
+_cache_counts: Counter[str] = Counter()
+
+
+def _open_disk_cache() -> Optional[SQLiteCache]:
+    """Open the persistent result cache, or run memory-only if that fails."""
+    try:
+        return SQLiteCache(CACHE_DIR / "results.sqlite3")
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("Persistent cache disabled: %s", e)
+        return None
+
+
+# Persistent second tier, so a restarted server does not spend quota again on
+# results it fetched moments before. Entries are keyed by a hash of the
+# authorized account, tool and arguments.
+_disk_cache = _open_disk_cache()
+
+
+# Cacheable calls currently in flight, keyed by (tool name, cache key).
+# Identical calls arriving while one is running await its task instead of
+# issuing a duplicate request; the cache covers the ones that come later.
+_inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+
+def _cache_key(arguments: dict) -> str:
+    """Build a cache key from validated tool arguments of the current account.
+
+    Results such as list_videos depend on the authorized account, so both
+    cache tiers (and in-flight sharing) are keyed by it: re-authorizing as
+    another account never serves the previous account's results.
+    """
+    from .auth import get_auth
+
+    return get_auth().cache_namespace() + json.dumps(arguments, sort_keys=True, ensure_ascii=False)
+
+
+def _disk_key(name: str, cache_key: str) -> str:
+    """Build the persistent cache key for a tool call."""
+    raw = f"{name}\0{cache_key}"
+    # Prefixed with the tool name so a tool's entries can be dropped together
+    return f"{name}:{hashlib.sha256(raw.encode()).hexdigest()}"
 
-def _result_to_text(result: Any) -> str:
-    """Convert a result to JSON string."""
-    if hasattr(result, "model_dump"):
-        return json.dumps(result.model_dump(), indent=2, ensure_ascii=False)
+
+def _cache_get(name: str, cache: TTLCache, cache_key: str) -> Any:
+    """Look a tool call up in the memory cache, then the persistent one."""
+    result = cache.get(cache_key)
+    if result is MISSING and _disk_cache is not None:
+        result = _disk_cache.get(_disk_key(name, cache_key))
+    _cache_counts["misses" if result is MISSING else "hits"] += 1
+    return result
+
+
+def _cache_set(name: str, cache: TTLCache, cache_key: str, result: Any) -> None:
+    """Store a tool result in both cache tiers."""
+    cache.set(cache_key, result)
+    if _disk_cache is not None:
+        try:
+            _disk_cache.set(_disk_key(name, cache_key), to_jsonable_python(result), _CACHE_TTL[name])
+        except sqlite3.Error as e:
+            logger.warning("Could not persist cached result of %s: %s", name, e)
+
+
+def _clear_caches() -> dict:
+    """Drop every cached tool result."""
+    cleared = sum(cache.clear() for cache in _caches.values())
+    if _disk_cache is not None:
+        cleared += _disk_cache.clear()
+    return {"cleared_entries": cleared}
+
+
+def _invalidate_caches(name: str) -> None:
+    """Drop the cached results that a completed write tool call made stale."""
+    for stale in _INVALIDATES.get(name, ()):
+        _caches[stale].clear()
+        if _disk_cache is not None:
+            try:
+                _disk_cache.clear_prefix(f"{stale}:")
+            except sqlite3.Error as e:
+                logger.warning("Could not drop persisted results of %s: %s", stale, e)
+
+
+def _get_cache_stats() -> dict:
+    """Report cache sizes and hit counts since start-up."""
+    return {
+        "memory_entries": sum(len(cache) for cache in _caches.values()),
+        "disk_entries": len(_disk_cache) if _disk_cache is not None else 0,
+        "disk_path": str(_disk_cache.path) if _disk_cache is not None else None,
+        "hits": _cache_counts["hits"],
+        "misses": _cache_counts["misses"],
+    }
+
+
+# Tools implemented by the server itself rather than a tool submodule
+_LOCAL_TOOLS = {
+    "youtube_cache_clear": _clear_caches,
+    "youtube_cache_stats": _get_cache_stats,
+}
+
+
+def _dump_item(item: Any, include: Optional[set[str]]) -> Any:
+    """Convert a single result item to plain data, keeping only `include` keys."""
+    if hasattr(item, "model_dump"):
+        return item.model_dump(include=include)
+    if include is not None and isinstance(item, dict):
+        return {key: value for key, value in item.items() if key in include}
+    return item
+
+
+def _dumps(data: Any) -> str:
+    """Serialize plain data to indented JSON."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _result_to_text(result: Any, fields: Optional[list[str]] = None) -> str:
+    """Convert a result to JSON string.
+
+    Args:
+        result: Tool result (model, list of models/dicts, dict, or scalar)
+        fields: Optional list of field names to keep on each item
+    """
+    if isinstance(result, str):
+        return result
+    include = set(fields) if fields else None
+    if hasattr(result, "model_dump") or isinstance(result, dict):
+        return _dumps(_dump_item(result, include))
     elif isinstance(result, list):
-        return json.dumps(
-            [item.model_dump() if hasattr(item, "model_dump") else item for item in result],
-            indent=2,
-            ensure_ascii=False,
-        )
-    elif isinstance(result, dict):
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return _dumps([_dump_item(item, include) for item in result])
     else:
         return str(result)
 
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available YouTube tools."""
-    return [
-        # Upload tools
-        Tool(
-            name="youtube_upload_video",
-            description="Upload a video to YouTube. Supports large files with resumable upload.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the video file to upload",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "Video title (max 100 characters)",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Video description (max 5000 characters)",
-                        "default": "",
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "List of tags for the video",
-                        "default": [],
-                    },
-                    "privacy": {
-                        "type": "string",
-                        "enum": ["public", "private", "unlisted"],
-                        "description": "Privacy status of the video",
-                        "default": "private",
-                    },
-                    "category_id": {
-                        "type": "string",
-                        "description": "YouTube category ID (default: 22 = People & Blogs)",
-                        "default": "22",
-                    },
-                    "thumbnail_path": {
-                        "type": "string",
-                        "description": "Optional path to thumbnail image",
-                    },
-                },
-                "required": ["file_path", "title"],
+# Date-range properties shared by the analytics tool schemas. A read-only view
+# over a single dict, splatted into each schema so they all stay in sync.
+_DATE_RANGE = MappingProxyType({
+    "start_date": {
+        "type": "string",
+        "description": "Start date (YYYY-MM-DD), defaults to 28 days ago",
+    },
+    "end_date": {
+        "type": "string",
+        "description": "End date (YYYY-MM-DD), defaults to today",
+    },
+})
+
+# Cache bypass flag accepted by the read-only tools
+_NO_CACHE_PROP = {
+    "type": "boolean",
+    "description": "Bypass the response cache and fetch fresh data from the API",
+    "default": False,
+}
+
+# Output projection accepted by the list-returning tools
+_FIELDS_PROP = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "Only return these fields of each item (optional, default: all fields)",
+}
+
+
+# Input schema of youtube_update_video, also the item schema of its plural form
+_UPDATE_VIDEO_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "video_id": {
+            "type": "string",
+            "description": "YouTube video ID",
+        },
+        "title": {
+            "type": "string",
+            "description": "New title (optional)",
+        },
+        "description": {
+            "type": "string",
+            "description": "New description (optional)",
+        },
+        "tags": {
+            "type": "array",
+            "items": {"type": "string"},
+            "description": "New tags (optional)",
+        },
+        "privacy": {
+            "type": "string",
+            "enum": ["public", "private", "unlisted"],
+            "description": "New privacy status (optional)",
+        },
+        "category_id": {
+            "type": "string",
+            "description": "New category ID (optional)",
+        },
+    },
+    "required": ["video_id"],
+}
+
+
+# Tool definitions, built once at import. Clients poll list_tools often and
+# the schemas never change while the server runs.
+_TOOLS: list[Tool] = [
+    # Upload tools
+    Tool(
+        name="youtube_upload_video",
+        description="Upload a video to YouTube. Supports large files with resumable upload.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the video file to upload",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "Video title (max 100 characters)",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Video description (max 5000 characters)",
+                    "default": "",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of tags for the video",
+                    "default": [],
+                },
+                "privacy": {
+                    "type": "string",
+                    "enum": ["public", "private", "unlisted"],
+                    "description": "Privacy status of the video",
+                    "default": "private",
+                },
+                "category_id": {
+                    "type": "string",
+                    "description": "YouTube category ID (default: 22 = People & Blogs)",
+                    "default": "22",
+                },
+                "thumbnail_path": {
+                    "type": "string",
+                    "description": "Optional path to thumbnail image",
+                },
+                "chunk_size_mib": {
+                    "type": "integer",
+                    "description": "Upload chunk size in MiB (1-256). Larger chunks upload faster on high-latency links; smaller ones resend less after a network error. If omitted, the size adapts to the measured upload speed. Files up to 5 MiB are sent in a single request.",
+                    "minimum": 1,
+                    "maximum": 256,
+                },
             },
-        ),
-        Tool(
-            name="youtube_set_thumbnail",
-            description="Set a custom thumbnail for a video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "thumbnail_path": {
-                        "type": "string",
-                        "description": "Path to thumbnail image (JPG, PNG, or GIF, max 2MB)",
-                    },
-                },
-                "required": ["video_id", "thumbnail_path"],
+            "required": ["file_path", "title"],
+        },
+    ),
+    Tool(
+        name="youtube_set_thumbnail",
+        description="Set a custom thumbnail for a video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "thumbnail_path": {
+                    "type": "string",
+                    "description": "Path to thumbnail image (JPG, PNG, or GIF, max 2MB)",
+                },
+                "reencode": {
+                    "type": "boolean",
+                    "description": "Upload PNGs over 512 KiB as JPEG (quality 90) when that is smaller, for a faster upload. Needs the speedups extra.",
+                    "default": True,
+                },
             },
-        ),
-        # Management tools
-        Tool(
-            name="youtube_get_video",
-            description="Get detailed information about a specific video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                },
-                "required": ["video_id"],
+            "required": ["video_id", "thumbnail_path"],
+        },
+    ),
+    # Management tools
+    Tool(
+        name="youtube_get_video",
+        description="Get detailed information about a specific video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_list_videos",
-            description="List videos from the authenticated user's channel.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of videos to return (1-50)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
-                    "order": {
-                        "type": "string",
-                        "enum": ["date", "rating", "viewCount", "title"],
-                        "description": "Sort order",
-                        "default": "date",
-                    },
+            "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_get_videos_batch",
+        description="Get detailed information about multiple videos at once (fetched 50 per API call). Prefer this over repeated youtube_get_video calls.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "YouTube video IDs",
+                    "minItems": 1,
                 },
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        Tool(
-            name="youtube_update_video",
-            description="Update video metadata (title, description, tags, privacy).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title (optional)",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New description (optional)",
-                    },
-                    "tags": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "New tags (optional)",
-                    },
-                    "privacy": {
-                        "type": "string",
-                        "enum": ["public", "private", "unlisted"],
-                        "description": "New privacy status (optional)",
-                    },
-                    "category_id": {
-                        "type": "string",
-                        "description": "New category ID (optional)",
-                    },
-                },
-                "required": ["video_id"],
+            "required": ["video_ids"],
+        },
+    ),
+    Tool(
+        name="youtube_list_videos",
+        description="List videos from the authenticated user's channel.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of videos to return (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "order": {
+                    "type": "string",
+                    "enum": ["date", "rating", "viewCount", "title"],
+                    "description": "Sort order",
+                    "default": "date",
+                },
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        Tool(
-            name="youtube_set_video_localization",
-            description="Add or update a localized (translated) title and description for a video. Use this to make videos discoverable in other languages. Supports any BCP-47 language code.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": "BCP-47 language code (e.g., 'es' for Spanish, 'fr' for French, 'de' for German, 'pt' for Portuguese, 'hi' for Hindi, 'ja' for Japanese, 'tl' for Tagalog)",
-                    },
-                    "localized_title": {
-                        "type": "string",
-                        "description": "Translated title (max 100 characters)",
-                    },
-                    "localized_description": {
-                        "type": "string",
-                        "description": "Translated description (max 5000 characters)",
-                    },
-                },
-                "required": ["video_id", "language", "localized_title", "localized_description"],
+        },
+    ),
+    Tool(
+        name="youtube_update_video",
+        description="Update video metadata (title, description, tags, privacy).",
+        inputSchema=_UPDATE_VIDEO_SCHEMA,
+    ),
+    Tool(
+        name="youtube_update_videos",
+        description="Update metadata of several videos at once. Updates are sent concurrently; each result is the updated video or an error.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "updates": {
+                    "type": "array",
+                    "items": _UPDATE_VIDEO_SCHEMA,
+                    "description": "One entry per video, with the same fields as youtube_update_video",
+                },
             },
-        ),
-        Tool(
-            name="youtube_delete_video",
-            description="Delete a video from YouTube. This action cannot be undone.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID to delete",
-                    },
-                },
-                "required": ["video_id"],
+            "required": ["updates"],
+        },
+    ),
+    Tool(
+        name="youtube_set_video_localization",
+        description="Add or update a localized (translated) title and description for a video. Use this to make videos discoverable in other languages. Supports any BCP-47 language code.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "language": {
+                    "type": "string",
+                    "description": "BCP-47 language code (e.g., 'es' for Spanish, 'fr' for French, 'de' for German, 'pt' for Portuguese, 'hi' for Hindi, 'ja' for Japanese, 'tl' for Tagalog)",
+                },
+                "localized_title": {
+                    "type": "string",
+                    "description": "Translated title (max 100 characters)",
+                },
+                "localized_description": {
+                    "type": "string",
+                    "description": "Translated description (max 5000 characters)",
+                },
             },
-        ),
-        # Analytics tools
-        Tool(
-            name="youtube_channel_stats",
-            description="Get channel statistics including subscriber count, total views, and video count.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["video_id", "language", "localized_title", "localized_description"],
+        },
+    ),
+    Tool(
+        name="youtube_delete_video",
+        description="Delete a video from YouTube. This action cannot be undone.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID to delete",
+                },
             },
-        ),
-        Tool(
-            name="youtube_video_analytics",
-            description="Get analytics for a specific video including views, watch time, likes, comments, and subscriber changes.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD), defaults to 28 days ago",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD), defaults to today",
-                    },
-                },
-                "required": ["video_id"],
+            "required": ["video_id"],
+        },
+    ),
+    # Analytics tools
+    Tool(
+        name="youtube_channel_stats",
+        description="Get channel statistics including subscriber count, total views, and video count.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_audience_retention",
-            description="Get audience retention data for a video, showing how viewers engage throughout the video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD), defaults to 28 days ago",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD), defaults to today",
-                    },
-                },
-                "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_video_analytics",
+        description="Get analytics for a specific video including views, watch time, likes, comments, and subscriber changes.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_traffic_sources",
-            description="Get traffic source breakdown showing where viewers are coming from.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID (optional, if omitted gets channel-wide data)",
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD)",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD)",
-                    },
+            "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_videos_analytics",
+        description="Get analytics for multiple videos at once (one report query per 200 videos). Prefer this over repeated youtube_video_analytics calls.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "YouTube video IDs",
+                    "minItems": 1,
                 },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        Tool(
-            name="youtube_demographics",
-            description="Get audience demographics including age, gender, and geographic distribution.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD)",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD)",
-                    },
+            "required": ["video_ids"],
+        },
+    ),
+    Tool(
+        name="youtube_audience_retention",
+        description="Get audience retention data for a video, showing how viewers engage throughout the video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
                 },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_top_videos",
-            description="Get top performing videos ranked by a specific metric.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "metric": {
-                        "type": "string",
-                        "enum": ["views", "watchTime", "likes", "comments"],
-                        "description": "Metric to sort by",
-                        "default": "views",
-                    },
-                    "period_days": {
-                        "type": "integer",
-                        "description": "Number of days to analyze",
-                        "default": 28,
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of videos to return",
-                        "default": 10,
-                    },
+            "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_traffic_sources",
+        description="Get traffic source breakdown showing where viewers are coming from.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID (optional, if omitted gets channel-wide data)",
                 },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
+            },
+        },
+    ),
+    Tool(
+        name="youtube_demographics",
+        description="Get audience demographics including age, gender, and geographic distribution.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_revenue_report",
-            description="Get revenue report including estimated earnings, CPM, and RPM. Requires monetization enabled.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD)",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD)",
-                    },
+        },
+    ),
+    Tool(
+        name="youtube_top_videos",
+        description="Get top performing videos ranked by a specific metric.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "metric": {
+                    "type": "string",
+                    "enum": ["views", "watchTime", "likes", "comments"],
+                    "description": "Metric to sort by",
+                    "default": "views",
                 },
+                "period_days": {
+                    "type": "integer",
+                    "description": "Number of days to analyze",
+                    "default": 28,
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of videos to return",
+                    "default": 10,
+                },
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        # Comments tools
-        Tool(
-            name="youtube_list_comments",
-            description="List top-level comments on a video. Returns comment ID, author, text, likes, and reply count.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of comments to return (1-100)",
-                        "default": 20,
-                        "minimum": 1,
-                        "maximum": 100,
-                    },
-                    "order": {
-                        "type": "string",
-                        "enum": ["time", "relevance"],
-                        "description": "Sort order (time=newest, relevance=top)",
-                        "default": "time",
-                    },
-                },
-                "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_revenue_report",
+        description="Get revenue report including estimated earnings, CPM, and RPM. Requires monetization enabled.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_reply_to_comment",
-            description="Reply to a YouTube comment. Use list_comments first to get the comment_id.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "comment_id": {
-                        "type": "string",
-                        "description": "The comment ID to reply to (from list_comments)",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Reply text (max 10000 characters)",
-                    },
-                },
-                "required": ["comment_id", "text"],
+        },
+    ),
+    # Comments tools
+    Tool(
+        name="youtube_list_comments",
+        description="List top-level comments on a video. Returns comment ID, author, text, likes, and reply count.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of comments to return (1-500; more than 100 costs one quota unit per extra page of 100)",
+                    "default": 20,
+                    "minimum": 1,
+                    "maximum": 500,
+                },
+                "order": {
+                    "type": "string",
+                    "enum": ["time", "relevance"],
+                    "description": "Sort order (time=newest, relevance=top)",
+                    "default": "time",
+                },
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
+            },
+            "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_reply_to_comment",
+        description="Reply to a YouTube comment. Use list_comments first to get the comment_id.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "comment_id": {
+                    "type": "string",
+                    "description": "The comment ID to reply to (from list_comments)",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Reply text (max 10000 characters)",
+                },
+            },
+            "required": ["comment_id", "text"],
+        },
+    ),
+    Tool(
+        name="youtube_get_comment_replies",
+        description="Get replies to a specific comment.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "comment_id": {
+                    "type": "string",
+                    "description": "The parent comment ID",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of replies to return (1-100)",
+                    "default": 20,
+                },
+                "no_cache": _NO_CACHE_PROP,
+            },
+            "required": ["comment_id"],
+        },
+    ),
+    Tool(
+        name="youtube_post_comment",
+        description="Post a new top-level comment on a video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "text": {
+                    "type": "string",
+                    "description": "Comment text (max 10000 characters)",
+                },
+            },
+            "required": ["video_id", "text"],
+        },
+    ),
+    Tool(
+        name="youtube_moderate_comment",
+        description="Set the moderation status of a comment (publish, hold for review, or reject).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "comment_id": {
+                    "type": "string",
+                    "description": "The comment ID to moderate",
+                },
+                "moderation_status": {
+                    "type": "string",
+                    "enum": ["published", "heldForReview", "rejected"],
+                    "description": "New moderation status",
+                    "default": "published",
+                },
+                "ban_author": {
+                    "type": "boolean",
+                    "description": "Also ban the comment author (only with 'rejected')",
+                    "default": False,
+                },
             },
-        ),
-        Tool(
-            name="youtube_get_comment_replies",
-            description="Get replies to a specific comment.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "comment_id": {
-                        "type": "string",
-                        "description": "The parent comment ID",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of replies to return (1-100)",
-                        "default": 20,
-                    },
-                },
-                "required": ["comment_id"],
+            "required": ["comment_id"],
+        },
+    ),
+    Tool(
+        name="youtube_moderate_comments",
+        description="Set the moderation status of several comments in one call (50 per API request). Returns the moderated IDs and an error per comment that failed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "comment_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The comment IDs to moderate",
+                    "minItems": 1,
+                },
+                "moderation_status": {
+                    "type": "string",
+                    "enum": ["published", "heldForReview", "rejected"],
+                    "description": "New moderation status",
+                    "default": "published",
+                },
+                "ban_author": {
+                    "type": "boolean",
+                    "description": "Also ban the comment authors (only with 'rejected')",
+                    "default": False,
+                },
             },
-        ),
-        Tool(
-            name="youtube_post_comment",
-            description="Post a new top-level comment on a video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "text": {
-                        "type": "string",
-                        "description": "Comment text (max 10000 characters)",
-                    },
-                },
-                "required": ["video_id", "text"],
+            "required": ["comment_ids"],
+        },
+    ),
+    Tool(
+        name="youtube_list_held_comments",
+        description="List comments held for review on a video or across the channel.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID (optional, omit for all held comments)",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of comments to return (1-100)",
+                    "default": 20,
+                },
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_moderate_comment",
-            description="Set the moderation status of a comment (publish, hold for review, or reject).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "comment_id": {
-                        "type": "string",
-                        "description": "The comment ID to moderate",
-                    },
-                    "moderation_status": {
-                        "type": "string",
-                        "enum": ["published", "heldForReview", "rejected"],
-                        "description": "New moderation status",
-                        "default": "published",
-                    },
-                    "ban_author": {
-                        "type": "boolean",
-                        "description": "Also ban the comment author (only with 'rejected')",
-                        "default": False,
-                    },
-                },
-                "required": ["comment_id"],
+        },
+    ),
+    # Playlist tools
+    Tool(
+        name="youtube_list_playlists",
+        description="List playlists owned by the authenticated user.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of playlists to return (1-50)",
+                    "default": 25,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_list_held_comments",
-            description="List comments held for review on a video or across the channel.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID (optional, omit for all held comments)",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of comments to return (1-100)",
-                        "default": 20,
-                    },
+        },
+    ),
+    Tool(
+        name="youtube_create_playlist",
+        description="Create a new playlist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Playlist title (max 150 characters)",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "Playlist description (max 5000 characters)",
+                    "default": "",
+                },
+                "privacy": {
+                    "type": "string",
+                    "enum": ["public", "private", "unlisted"],
+                    "description": "Privacy status",
+                    "default": "private",
                 },
             },
-        ),
-        # Playlist tools
-        Tool(
-            name="youtube_list_playlists",
-            description="List playlists owned by the authenticated user.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of playlists to return (1-50)",
-                        "default": 25,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="youtube_update_playlist",
+        description="Update a playlist's title, description, or privacy.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "YouTube playlist ID",
+                },
+                "title": {
+                    "type": "string",
+                    "description": "New title (optional)",
+                },
+                "description": {
+                    "type": "string",
+                    "description": "New description (optional)",
+                },
+                "privacy": {
+                    "type": "string",
+                    "enum": ["public", "private", "unlisted"],
+                    "description": "New privacy status (optional)",
                 },
             },
-        ),
-        Tool(
-            name="youtube_create_playlist",
-            description="Create a new playlist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Playlist title (max 150 characters)",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "Playlist description (max 5000 characters)",
-                        "default": "",
-                    },
-                    "privacy": {
-                        "type": "string",
-                        "enum": ["public", "private", "unlisted"],
-                        "description": "Privacy status",
-                        "default": "private",
-                    },
-                },
-                "required": ["title"],
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="youtube_delete_playlist",
+        description="Delete a playlist. This action cannot be undone.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "YouTube playlist ID",
+                },
             },
-        ),
-        Tool(
-            name="youtube_update_playlist",
-            description="Update a playlist's title, description, or privacy.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "YouTube playlist ID",
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New title (optional)",
-                    },
-                    "description": {
-                        "type": "string",
-                        "description": "New description (optional)",
-                    },
-                    "privacy": {
-                        "type": "string",
-                        "enum": ["public", "private", "unlisted"],
-                        "description": "New privacy status (optional)",
-                    },
-                },
-                "required": ["playlist_id"],
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="youtube_list_playlist_items",
+        description="List items (videos) in a playlist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "YouTube playlist ID",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of items to return (1-500; more than 50 costs one quota unit per extra page of 50)",
+                    "default": 25,
+                    "minimum": 1,
+                    "maximum": 500,
+                },
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        Tool(
-            name="youtube_delete_playlist",
-            description="Delete a playlist. This action cannot be undone.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "YouTube playlist ID",
-                    },
-                },
-                "required": ["playlist_id"],
+            "required": ["playlist_id"],
+        },
+    ),
+    Tool(
+        name="youtube_add_to_playlist",
+        description="Add a video to a playlist.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_id": {
+                    "type": "string",
+                    "description": "YouTube playlist ID",
+                },
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID to add",
+                },
+                "position": {
+                    "type": "integer",
+                    "description": "Position in playlist (0-based, optional — appends if omitted)",
+                },
             },
-        ),
-        Tool(
-            name="youtube_list_playlist_items",
-            description="List items (videos) in a playlist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "YouTube playlist ID",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of items to return (1-50)",
-                        "default": 25,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
-                },
-                "required": ["playlist_id"],
+            "required": ["playlist_id", "video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_remove_from_playlist",
+        description="Remove an item from a playlist. Use list_playlist_items to get the playlist_item_id.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_item_id": {
+                    "type": "string",
+                    "description": "The playlist item ID (from list_playlist_items)",
+                },
             },
-        ),
-        Tool(
-            name="youtube_add_to_playlist",
-            description="Add a video to a playlist.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_id": {
-                        "type": "string",
-                        "description": "YouTube playlist ID",
-                    },
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID to add",
-                    },
-                    "position": {
-                        "type": "integer",
-                        "description": "Position in playlist (0-based, optional — appends if omitted)",
-                    },
-                },
-                "required": ["playlist_id", "video_id"],
+            "required": ["playlist_item_id"],
+        },
+    ),
+    Tool(
+        name="youtube_remove_from_playlist_bulk",
+        description="Remove several items from playlists, sent as batched API requests. Returns the removed IDs and an error per item that failed.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "playlist_item_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The playlist item IDs (from list_playlist_items)",
+                    "minItems": 1,
+                },
             },
-        ),
-        Tool(
-            name="youtube_remove_from_playlist",
-            description="Remove an item from a playlist. Use list_playlist_items to get the playlist_item_id.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "playlist_item_id": {
-                        "type": "string",
-                        "description": "The playlist item ID (from list_playlist_items)",
-                    },
-                },
-                "required": ["playlist_item_id"],
+            "required": ["playlist_item_ids"],
+        },
+    ),
+    # Caption tools
+    Tool(
+        name="youtube_list_captions",
+        description="List caption tracks for a video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        # Caption tools
-        Tool(
-            name="youtube_list_captions",
-            description="List caption tracks for a video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                },
-                "required": ["video_id"],
+            "required": ["video_id"],
+        },
+    ),
+    Tool(
+        name="youtube_upload_caption",
+        description="Upload a caption track for a video. Provide caption content via body (raw text) or file_path.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
+                },
+                "language": {
+                    "type": "string",
+                    "description": "BCP-47 language code (e.g., 'en', 'es', 'fr')",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Caption track name (e.g., 'English CC')",
+                    "default": "",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Caption content as string (SRT, SBV, or VTT format)",
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to caption file (alternative to body)",
+                },
+                "is_draft": {
+                    "type": "boolean",
+                    "description": "Whether the caption is a draft",
+                    "default": False,
+                },
             },
-        ),
-        Tool(
-            name="youtube_upload_caption",
-            description="Upload a caption track for a video. Provide caption content via body (raw text) or file_path.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID",
-                    },
-                    "language": {
-                        "type": "string",
-                        "description": "BCP-47 language code (e.g., 'en', 'es', 'fr')",
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "Caption track name (e.g., 'English CC')",
-                        "default": "",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Caption content as string (SRT, SBV, or VTT format)",
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to caption file (alternative to body)",
-                    },
-                    "is_draft": {
-                        "type": "boolean",
-                        "description": "Whether the caption is a draft",
-                        "default": False,
-                    },
-                },
-                "required": ["video_id", "language"],
+            "required": ["video_id", "language"],
+        },
+    ),
+    Tool(
+        name="youtube_update_caption",
+        description="Update an existing caption track's metadata or content.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "caption_id": {
+                    "type": "string",
+                    "description": "Caption track ID",
+                },
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID (for reference)",
+                    "default": "",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "New caption track name (optional)",
+                },
+                "is_draft": {
+                    "type": "boolean",
+                    "description": "New draft status (optional)",
+                },
+                "body": {
+                    "type": "string",
+                    "description": "New caption content (optional)",
+                },
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to new caption file (optional)",
+                },
             },
-        ),
-        Tool(
-            name="youtube_update_caption",
-            description="Update an existing caption track's metadata or content.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "caption_id": {
-                        "type": "string",
-                        "description": "Caption track ID",
-                    },
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID (for reference)",
-                        "default": "",
-                    },
-                    "name": {
-                        "type": "string",
-                        "description": "New caption track name (optional)",
-                    },
-                    "is_draft": {
-                        "type": "boolean",
-                        "description": "New draft status (optional)",
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "New caption content (optional)",
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to new caption file (optional)",
-                    },
-                },
-                "required": ["caption_id"],
+            "required": ["caption_id"],
+        },
+    ),
+    Tool(
+        name="youtube_download_caption",
+        description="Download a caption track's content as text.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "caption_id": {
+                    "type": "string",
+                    "description": "Caption track ID",
+                },
+                "fmt": {
+                    "type": "string",
+                    "enum": ["srt", "sbv", "vtt"],
+                    "description": "Download format",
+                    "default": "srt",
+                },
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        Tool(
-            name="youtube_download_caption",
-            description="Download a caption track's content as text.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "caption_id": {
-                        "type": "string",
-                        "description": "Caption track ID",
-                    },
-                    "fmt": {
-                        "type": "string",
-                        "enum": ["srt", "sbv", "vtt"],
-                        "description": "Download format",
-                        "default": "srt",
-                    },
-                },
-                "required": ["caption_id"],
+            "required": ["caption_id"],
+        },
+    ),
+    Tool(
+        name="youtube_delete_caption",
+        description="Delete a caption track.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "caption_id": {
+                    "type": "string",
+                    "description": "Caption track ID",
+                },
             },
-        ),
-        Tool(
-            name="youtube_delete_caption",
-            description="Delete a caption track.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "caption_id": {
-                        "type": "string",
-                        "description": "Caption track ID",
-                    },
-                },
-                "required": ["caption_id"],
+            "required": ["caption_id"],
+        },
+    ),
+    # Search tools
+    Tool(
+        name="youtube_search",
+        description="Search YouTube for videos, channels, or playlists. Note: each call costs 100 API quota units.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query string",
+                },
+                "type": {
+                    "type": "string",
+                    "enum": ["video", "channel", "playlist"],
+                    "description": "Type of results to return",
+                    "default": "video",
+                },
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of results (1-50)",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "order": {
+                    "type": "string",
+                    "enum": ["relevance", "date", "viewCount", "rating"],
+                    "description": "Sort order",
+                    "default": "relevance",
+                },
+                "channel_id": {
+                    "type": "string",
+                    "description": "Restrict to a specific channel (optional). Use 'mine' for your own channel; such video searches are answered from locally indexed videos (see youtube_list_videos) without quota cost when they match",
+                },
+                "published_after": {
+                    "type": "string",
+                    "description": "Filter by publish date (RFC 3339, e.g. '2024-01-01T00:00:00Z')",
+                },
+                "published_before": {
+                    "type": "string",
+                    "description": "Filter by publish date (RFC 3339)",
+                },
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-        # Search tools
-        Tool(
-            name="youtube_search",
-            description="Search YouTube for videos, channels, or playlists. Note: each call costs 100 API quota units.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query string",
-                    },
-                    "type": {
-                        "type": "string",
-                        "enum": ["video", "channel", "playlist"],
-                        "description": "Type of results to return",
-                        "default": "video",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of results (1-50)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
-                    "order": {
-                        "type": "string",
-                        "enum": ["relevance", "date", "viewCount", "rating"],
-                        "description": "Sort order",
-                        "default": "relevance",
-                    },
-                    "channel_id": {
-                        "type": "string",
-                        "description": "Restrict to a specific channel (optional)",
-                    },
-                    "published_after": {
-                        "type": "string",
-                        "description": "Filter by publish date (RFC 3339, e.g. '2024-01-01T00:00:00Z')",
-                    },
-                    "published_before": {
-                        "type": "string",
-                        "description": "Filter by publish date (RFC 3339)",
-                    },
-                },
-                "required": ["query"],
+            "required": ["query"],
+        },
+    ),
+    # Extended analytics tools
+    Tool(
+        name="youtube_device_analytics",
+        description="Get analytics breakdown by device type (mobile, desktop, tablet, etc.).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID (optional, omit for channel-wide data)",
+                },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        # Extended analytics tools
-        Tool(
-            name="youtube_device_analytics",
-            description="Get analytics breakdown by device type (mobile, desktop, tablet, etc.).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID (optional, omit for channel-wide data)",
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD)",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD)",
-                    },
+        },
+    ),
+    Tool(
+        name="youtube_playback_locations",
+        description="Get analytics by playback location (YouTube watch page, embedded, etc.).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID (optional, omit for channel-wide data)",
                 },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        Tool(
-            name="youtube_playback_locations",
-            description="Get analytics by playback location (YouTube watch page, embedded, etc.).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "video_id": {
-                        "type": "string",
-                        "description": "YouTube video ID (optional, omit for channel-wide data)",
-                    },
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD)",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD)",
-                    },
+        },
+    ),
+    Tool(
+        name="youtube_content_performance",
+        description="Get detailed performance metrics (views, watch time, likes, comments, shares, subscribers) for each video.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                **_DATE_RANGE,
+                "max_results": {
+                    "type": "integer",
+                    "description": "Maximum number of videos to return (1-50)",
+                    "default": 25,
+                    "minimum": 1,
+                    "maximum": 50,
+                },
+                "columnar": {
+                    "type": "boolean",
+                    "description": "Return one list per metric (video_ids, titles, views, ...) instead of one object per video; more compact for large reports",
+                    "default": False,
                 },
+                "no_cache": _NO_CACHE_PROP,
+                "fields": _FIELDS_PROP,
             },
-        ),
-        Tool(
-            name="youtube_content_performance",
-            description="Get detailed performance metrics (views, watch time, likes, comments, shares, subscribers) for each video.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "start_date": {
-                        "type": "string",
-                        "description": "Start date (YYYY-MM-DD)",
-                    },
-                    "end_date": {
-                        "type": "string",
-                        "description": "End date (YYYY-MM-DD)",
-                    },
-                    "max_results": {
-                        "type": "integer",
-                        "description": "Maximum number of videos to return (1-50)",
-                        "default": 25,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
+        },
+    ),
+    Tool(
+        name="youtube_video_bundle",
+        description="Get a video's analytics summary, audience retention, traffic sources, and device breakdown in one call.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "video_id": {
+                    "type": "string",
+                    "description": "YouTube video ID",
                 },
+                **_DATE_RANGE,
+                "no_cache": _NO_CACHE_PROP,
             },
-        ),
-    ]
+            "required": ["video_id"],
+        },
+    ),
+    # Cache tools
+    Tool(
+        name="youtube_cache_clear",
+        description="Clear the server's response cache so subsequent read tools fetch fresh data.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="youtube_cache_stats",
+        description="Show how many results the server has cached (in memory and on disk) and its cache hit counts.",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available YouTube tools."""
+    return _TOOLS
+
+
+def _invoke(name: str, arguments: dict) -> Any:
+    """Call the tool function behind name with validated arguments (blocking)."""
+    module_name, function_name = _DISPATCH[name]
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Dispatching %s to %s.%s with %r", name, module_name, function_name, arguments)
+    renames = _ARGUMENT_RENAMES.get(name)
+    if renames:
+        arguments = {renames.get(key, key): value for key, value in arguments.items()}
+    return getattr(_mod(module_name), function_name)(**arguments)
+
+
+def _retry_delay(name: str, e: HttpError, attempt: int) -> Optional[float]:
+    """Return seconds to wait before retrying a failed call, or None to give up."""
+    status = e.resp.status
+    details = e.error_details if isinstance(e.error_details, list) else []
+    reasons = {detail.get("reason") for detail in details if isinstance(detail, dict)}
+    rate_limited = status == 429 or (status == 403 and bool(reasons & _RATE_LIMIT_REASONS))
+    if not rate_limited and (status not in _RETRIABLE_STATUSES or name in _NON_IDEMPOTENT):
+        return None
+
+    retry_after = e.resp.get("retry-after")
+    if retry_after is not None:
+        try:
+            delay = max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+        else:
+            # Retrying any sooner would fail again, so a longer wait than
+            # the cap gives up rather than holding the call for that long
+            return delay if delay <= _RETRY_MAX_DELAY else None
+    backoff = _RETRY_BASE_DELAY * 2**attempt
+    return min(_RETRY_MAX_DELAY, backoff) + random.uniform(0, 0.5 * backoff)
+
+
+async def _call_with_retry(name: str, arguments: dict) -> Any:
+    """Run a tool on a worker thread, retrying transient API errors."""
+    cost = call_cost(name, arguments)
+    priority = TOOL_PRIORITY.get(name, PRIORITY_READ)
+    for attempt in range(_RETRY_ATTEMPTS):
+        await _quota.acquire(cost, priority, max_wait=_QUOTA_MAX_WAIT)
+        try:
+            if name in _UPLOAD_TOOLS:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    _upload_executor, functools.partial(_invoke, name, arguments)
+                )
+            return await asyncio.to_thread(_invoke, name, arguments)
+        except HttpError as e:
+            delay = None if attempt == _RETRY_ATTEMPTS - 1 else _retry_delay(name, e, attempt)
+            if delay is None:
+                raise
+            logger.warning(
+                "Tool %s got HTTP %s (%s); retry %d/%d in %.1fs",
+                name, e.resp.status, e.reason, attempt + 1, _RETRY_ATTEMPTS - 1, delay,
+            )
+            await asyncio.sleep(delay)
+
+
+def _error_text(name: str, e: Exception) -> str:
+    """Describe a failed tool call. Must be called from an except block."""
+    if isinstance(e, FileNotFoundError):
+        return f"File not found: {e}"
+    if isinstance(e, ValueError):
+        return f"Invalid value: {e}"
+    if isinstance(e, QuotaExceededError):
+        return f"Quota exceeded: {e}"
+    logger.exception("Error calling tool %s", name)
+    return f"Error: {type(e).__name__}: {e}"
+
+
+async def _fetch_and_cache(name: str, arguments: dict, cache: TTLCache, cache_key: str) -> Any:
+    """Run a cacheable tool and store its result."""
+    result = await _call_with_retry(name, arguments)
+    _cache_set(name, cache, cache_key, result)
+    return result
+
+
+async def _fetch_shared(name: str, arguments: dict, cache: TTLCache, cache_key: str) -> Any:
+    """Run a cacheable tool, sharing the call with identical concurrent ones."""
+    key = (name, cache_key)
+    task = _inflight.get(key)
+    if task is None:
+        task = _inflight[key] = asyncio.ensure_future(
+            _fetch_and_cache(name, arguments, cache, cache_key)
+        )
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shielded so that one caller being cancelled does not cancel the others
+    return await asyncio.shield(task)
+
+
+async def _fan_out(name: str, items: list[dict]) -> list[Any]:
+    """Run a tool once per item concurrently, returning results in item order.
+
+    A failed item yields {"error": ...} in its slot instead of failing the
+    whole call.
+    """
+    semaphore = asyncio.Semaphore(_FAN_OUT_CONCURRENCY)
+
+    async def run_item(arguments: dict) -> Any:
+        async with semaphore:
+            try:
+                result = await _call_with_retry(name, arguments)
+            except Exception as e:
+                return {"error": _error_text(name, e)}
+            _invalidate_caches(name)
+            return result
+
+    return await asyncio.gather(*(run_item(item) for item in items))
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool calls."""
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
     try:
-        result = None
-
-        # Upload tools
-        if name == "youtube_upload_video":
-            result = upload.upload_video(
-                file_path=arguments["file_path"],
-                title=arguments["title"],
-                description=arguments.get("description", ""),
-                tags=arguments.get("tags", []),
-                privacy=arguments.get("privacy", "private"),
-                category_id=arguments.get("category_id", "22"),
-                thumbnail_path=arguments.get("thumbnail_path"),
-            )
-        elif name == "youtube_set_thumbnail":
-            result = upload.set_thumbnail(
-                video_id=arguments["video_id"],
-                thumbnail_path=arguments["thumbnail_path"],
-            )
+        arguments = validator.validate_python(arguments or {})
+    except ValidationError as e:
+        return [TextContent(type="text", text=f"Invalid arguments: {e}")]
+    fields = arguments.pop("fields", None)
+    no_cache = arguments.pop("no_cache", False)
 
-        # Management tools
-        elif name == "youtube_get_video":
-            result = manage.get_video(video_id=arguments["video_id"])
-        elif name == "youtube_list_videos":
-            result = manage.list_videos(
-                max_results=arguments.get("max_results", 10),
-                order=arguments.get("order", "date"),
-            )
-        elif name == "youtube_update_video":
-            result = manage.update_video(
-                video_id=arguments["video_id"],
-                title=arguments.get("title"),
-                description=arguments.get("description"),
-                tags=arguments.get("tags"),
-                privacy=arguments.get("privacy"),
-                category_id=arguments.get("category_id"),
-            )
-        elif name == "youtube_set_video_localization":
-            result = manage.set_video_localization(
-                video_id=arguments["video_id"],
-                language=arguments["language"],
-                localized_title=arguments["localized_title"],
-                localized_description=arguments["localized_description"],
-            )
-        elif name == "youtube_delete_video":
-            result = manage.delete_video(video_id=arguments["video_id"])
-
-        # Analytics tools
-        elif name == "youtube_channel_stats":
-            result = analytics.get_channel_stats()
-        elif name == "youtube_video_analytics":
-            result = analytics.get_video_analytics(
-                video_id=arguments["video_id"],
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
-        elif name == "youtube_audience_retention":
-            result = analytics.get_audience_retention(
-                video_id=arguments["video_id"],
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
-        elif name == "youtube_traffic_sources":
-            result = analytics.get_traffic_sources(
-                video_id=arguments.get("video_id"),
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
-        elif name == "youtube_demographics":
-            result = analytics.get_demographics(
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
-        elif name == "youtube_top_videos":
-            result = analytics.get_top_videos(
-                metric=arguments.get("metric", "views"),
-                period_days=arguments.get("period_days", 28),
-                limit=arguments.get("limit", 10),
-            )
-        elif name == "youtube_revenue_report":
-            result = analytics.get_revenue_report(
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
+    local_tool = _LOCAL_TOOLS.get(name)
+    if local_tool is not None:
+        return [TextContent(type="text", text=_result_to_text(local_tool()))]
 
-        # Comments tools
-        elif name == "youtube_list_comments":
-            result = comments.list_comments(
-                video_id=arguments["video_id"],
-                max_results=arguments.get("max_results", 20),
-                order=arguments.get("order", "time"),
-            )
-        elif name == "youtube_reply_to_comment":
-            result = comments.reply_to_comment(
-                comment_id=arguments["comment_id"],
-                text=arguments["text"],
-            )
-        elif name == "youtube_get_comment_replies":
-            result = comments.get_comment_replies(
-                comment_id=arguments["comment_id"],
-                max_results=arguments.get("max_results", 20),
-            )
-        elif name == "youtube_post_comment":
-            result = comments.post_comment(
-                video_id=arguments["video_id"],
-                text=arguments["text"],
-            )
-        elif name == "youtube_moderate_comment":
-            result = comments.moderate_comment(
-                comment_id=arguments["comment_id"],
-                moderation_status=arguments.get("moderation_status", "published"),
-                ban_author=arguments.get("ban_author", False),
-            )
-        elif name == "youtube_list_held_comments":
-            result = comments.list_held_comments(
-                video_id=arguments.get("video_id"),
-                max_results=arguments.get("max_results", 20),
-            )
+    cache = _caches.get(name)
+    if cache is not None:
+        cache_key = _cache_key(arguments)
+        if not no_cache:
+            result = _cache_get(name, cache, cache_key)
+            if result is not MISSING:
+                return [TextContent(type="text", text=_result_to_text(result, fields))]
 
-        # Playlist tools
-        elif name == "youtube_list_playlists":
-            result = playlists.list_playlists(
-                max_results=arguments.get("max_results", 25),
-            )
-        elif name == "youtube_create_playlist":
-            result = playlists.create_playlist(
-                title=arguments["title"],
-                description=arguments.get("description", ""),
-                privacy=arguments.get("privacy", "private"),
-            )
-        elif name == "youtube_update_playlist":
-            result = playlists.update_playlist(
-                playlist_id=arguments["playlist_id"],
-                title=arguments.get("title"),
-                description=arguments.get("description"),
-                privacy=arguments.get("privacy"),
-            )
-        elif name == "youtube_delete_playlist":
-            result = playlists.delete_playlist(
-                playlist_id=arguments["playlist_id"],
-            )
-        elif name == "youtube_list_playlist_items":
-            result = playlists.list_playlist_items(
-                playlist_id=arguments["playlist_id"],
-                max_results=arguments.get("max_results", 25),
-            )
-        elif name == "youtube_add_to_playlist":
-            result = playlists.add_to_playlist(
-                playlist_id=arguments["playlist_id"],
-                video_id=arguments["video_id"],
-                position=arguments.get("position"),
-            )
-        elif name == "youtube_remove_from_playlist":
-            result = playlists.remove_from_playlist(
-                playlist_item_id=arguments["playlist_item_id"],
-            )
+    fan_out = _FAN_OUT.get(name)
+    if fan_out is not None:
+        list_key, item_tool = fan_out
+        results = await _fan_out(item_tool, arguments[list_key])
+        return [TextContent(type="text", text=_result_to_text(results, fields))]
 
-        # Caption tools
-        elif name == "youtube_list_captions":
-            result = captions.list_captions(
-                video_id=arguments["video_id"],
-            )
-        elif name == "youtube_upload_caption":
-            result = captions.upload_caption(
-                video_id=arguments["video_id"],
-                language=arguments["language"],
-                name=arguments.get("name", ""),
-                body=arguments.get("body", ""),
-                file_path=arguments.get("file_path"),
-                is_draft=arguments.get("is_draft", False),
-            )
-        elif name == "youtube_update_caption":
-            result = captions.update_caption(
-                caption_id=arguments["caption_id"],
-                video_id=arguments.get("video_id", ""),
-                name=arguments.get("name"),
-                is_draft=arguments.get("is_draft"),
-                body=arguments.get("body"),
-                file_path=arguments.get("file_path"),
-            )
-        elif name == "youtube_download_caption":
-            result = captions.download_caption(
-                caption_id=arguments["caption_id"],
-                fmt=arguments.get("fmt", "srt"),
-            )
-        elif name == "youtube_delete_caption":
-            result = captions.delete_caption(
-                caption_id=arguments["caption_id"],
-            )
+    try:
+        if cache is not None:
+            result = await _fetch_shared(name, arguments, cache, cache_key)
+        else:
+            result = await _call_with_retry(name, arguments)
+            _invalidate_caches(name)
+        return [TextContent(type="text", text=_result_to_text(result, fields))]
+    except Exception as e:
+        return [TextContent(type="text", text=_error_text(name, e))]
 
-        # Search tools
-        elif name == "youtube_search":
-            result = search.search(
-                query=arguments["query"],
-                result_type=arguments.get("type", "video"),
-                max_results=arguments.get("max_results", 10),
-                order=arguments.get("order", "relevance"),
-                channel_id=arguments.get("channel_id"),
-                published_after=arguments.get("published_after"),
-                published_before=arguments.get("published_before"),
-            )
 
-        # Extended analytics tools
-        elif name == "youtube_device_analytics":
-            result = analytics.get_device_analytics(
-                video_id=arguments.get("video_id"),
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
-        elif name == "youtube_playback_locations":
-            result = analytics.get_playback_locations(
-                video_id=arguments.get("video_id"),
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-            )
-        elif name == "youtube_content_performance":
-            result = analytics.get_content_performance(
-                start_date=arguments.get("start_date"),
-                end_date=arguments.get("end_date"),
-                max_results=arguments.get("max_results", 25),
-            )
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+# The OAuth access token is refreshed in the background this many seconds
+# before it expires, so no tool call waits on the token endpoint.
+_TOKEN_REFRESH_MARGIN = 300.0
 
-        return [TextContent(type="text", text=_result_to_text(result))]
 
-    except FileNotFoundError as e:
-        return [TextContent(type="text", text=f"File not found: {e}")]
-    except ValueError as e:
-        return [TextContent(type="text", text=f"Invalid value: {e}")]
-    except Exception as e:
-        logger.exception(f"Error calling tool {name}")
-        return [TextContent(type="text", text=f"Error: {type(e).__name__}: {e}")]
+async def _token_refresher() -> None:
+    """Keep the stored access token fresh for as long as the server runs."""
+    from .auth import get_auth
+
+    auth = get_auth()
+    while True:
+        try:
+            expiry = await asyncio.to_thread(auth.refresh_if_expiring, _TOKEN_REFRESH_MARGIN)
+        except Exception as e:
+            logger.warning("Background token refresh failed: %s", e)
+            delay = 60.0
+        else:
+            if expiry is None:
+                # Not authorized yet; check again later
+                delay = 600.0
+            else:
+                now = datetime.now(timezone.utc).replace(tzinfo=None)
+                delay = max(60.0, (expiry - now).total_seconds() - _TOKEN_REFRESH_MARGIN)
+        await asyncio.sleep(delay)
 
 
 async def run():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            server.create_initialization_options(),
-        )
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_API_WORKERS, thread_name_prefix="yt-api")
+    )
+    refresher = asyncio.create_task(_token_refresher())
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options(),
+            )
+    finally:
+        refresher.cancel()
 
 
 def main():
     """Main entry point."""
-    import asyncio
+    # uvloop (optional, see the "speedups" extra) replaces the default event
+    # loop with a libuv-based one; fall back to asyncio's loop when missing.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     asyncio.run(run())
 
 
@@ -1,93 +1,71 @@
 """YouTube MCP tools."""
 
-from .upload import upload_video, set_thumbnail
-from .manage import (
-    update_video,
-    list_videos,
-    get_video,
-    delete_video,
-    set_video_localization,
-)
-from .analytics import (
-    get_channel_stats,
-    get_video_analytics,
-    get_audience_retention,
-    get_traffic_sources,
-    get_demographics,
-    get_top_videos,
-    get_revenue_report,
-    get_device_analytics,
-    get_playback_locations,
-    get_content_performance,
-)
-from .comments import (
-    list_comments,
-    reply_to_comment,
-    get_comment_replies,
-    post_comment,
-    moderate_comment,
-    list_held_comments,
-)
-from .playlists import (
-    list_playlists,
-    create_playlist,
-    update_playlist,
-    delete_playlist,
-    list_playlist_items,
-    add_to_playlist,
-    remove_from_playlist,
-)
-from .captions import (
-    list_captions,
-    upload_caption,
-    update_caption,
-    download_caption,
-    delete_caption,
-)
-from .search import search
+import importlib
 
-__all__ = [
+# Public tool function -> submodule that defines it. Submodules are imported
+# lazily on first attribute access, so importing a single tool module does not
+# pull in every other module (and its Google API client imports) as well.
+_EXPORTS = {
     # Upload
-    "upload_video",
-    "set_thumbnail",
+    "upload_video": "upload",
+    "set_thumbnail": "upload",
     # Manage
-    "update_video",
-    "list_videos",
-    "get_video",
-    "delete_video",
-    "set_video_localization",
+    "update_video": "manage",
+    "list_videos": "manage",
+    "get_video": "manage",
+    "get_videos": "manage",
+    "delete_video": "manage",
+    "set_video_localization": "manage",
     # Analytics
-    "get_channel_stats",
-    "get_video_analytics",
-    "get_audience_retention",
-    "get_traffic_sources",
-    "get_demographics",
-    "get_top_videos",
-    "get_revenue_report",
-    "get_device_analytics",
-    "get_playback_locations",
-    "get_content_performance",
+    "get_channel_stats": "analytics",
+    "get_video_analytics": "analytics",
+    "get_videos_analytics": "analytics",
+    "get_audience_retention": "analytics",
+    "get_traffic_sources": "analytics",
+    "get_demographics": "analytics",
+    "get_top_videos": "analytics",
+    "get_revenue_report": "analytics",
+    "get_device_analytics": "analytics",
+    "get_playback_locations": "analytics",
+    "get_content_performance": "analytics",
+    "get_video_bundle": "analytics",
     # Comments
-    "list_comments",
-    "reply_to_comment",
-    "get_comment_replies",
-    "post_comment",
-    "moderate_comment",
-    "list_held_comments",
+    "list_comments": "comments",
+    "iter_comments": "comments",
+    "reply_to_comment": "comments",
+    "get_comment_replies": "comments",
+    "post_comment": "comments",
+    "moderate_comment": "comments",
+    "moderate_comments": "comments",
+    "list_held_comments": "comments",
     # Playlists
-    "list_playlists",
-    "create_playlist",
-    "update_playlist",
-    "delete_playlist",
-    "list_playlist_items",
-    "add_to_playlist",
-    "remove_from_playlist",
+    "list_playlists": "playlists",
+    "create_playlist": "playlists",
+    "update_playlist": "playlists",
+    "delete_playlist": "playlists",
+    "list_playlist_items": "playlists",
+    "iter_playlist_items": "playlists",
+    "add_to_playlist": "playlists",
+    "remove_from_playlist": "playlists",
+    "remove_from_playlist_bulk": "playlists",
     # Captions
-    "list_captions",
-    "upload_caption",
-    "update_caption",
-    "download_caption",
-    "delete_caption",
+    "list_captions": "captions",
+    "upload_caption": "captions",
+    "update_caption": "captions",
+    "download_caption": "captions",
+    "delete_caption": "captions",
     # Search
-    "search",
-]
+    "search": "search",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolve a public tool function, importing its submodule on first use."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,166 @@
+"""Shared Google API service objects for the tool modules."""
+
+import threading
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+from ..auth import get_auth, get_credentials
+
+# orjson (optional, see the "speedups" extra) parses API responses and
+# serializes request bodies several times faster than the json module; fall
+# back to json when missing.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Building a service parses the whole discovery document, and every service
+# carries its own HTTP connection, so services are built once and reused.
+# httplib2 connections are not thread-safe and tool calls run on a pool of
+# worker threads, hence one set of services per thread.
+#
+# The transport stays HTTP/1.1: googleapiclient only speaks the httplib2
+# interface, which has no HTTP/2 support. Each thread's connection is kept
+# alive between calls, so concurrent calls (see analytics._query_executor)
+# proceed in parallel over one socket per thread rather than queueing behind
+# a shared one.
+_local = threading.local()
+
+# Socket timeout in seconds for API requests. httplib2 waits indefinitely by
+# default, so a stalled connection would hold a worker thread forever.
+_HTTP_TIMEOUT = 60
+
+# Subrequests per HTTP batch request; the Data API documents batches of up to
+# 50 calls
+_BATCH_SIZE = 50
+
+# Authenticated channel ID per authorization (see YouTubeAuth.cache_namespace).
+# It cannot change without re-authenticating, so it is looked up once.
+_channel_ids: dict[str, str] = {}
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses JSON responses and serializes bodies with orjson."""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            return super().serialize(body_value)
+        data = orjson.dumps(body_value)
+        # The body must be an ASCII str: multipart and batch requests embed it
+        # in a MIME part, and http.client sends str bodies as Latin-1. orjson
+        # cannot escape non-ASCII characters, so json does those bodies.
+        if data.isascii():
+            return data.decode()
+        return super().serialize(body_value)
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Not JSON; the stock parser returns such content as text
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+def _get_service(name: str, version: str):
+    """Return this thread's service for an API, building it on first use.
+
+    Services are bound to the credentials they were built with, so they are
+    rebuilt when the credentials object changes (re-authentication, or a
+    revoked token being replaced). Token refreshes update the credentials in
+    place and keep the existing services.
+    """
+    credentials = get_credentials()
+    if getattr(_local, "credentials", None) is not credentials:
+        _local.credentials = credentials
+        _local.http = None
+        _local.services = {}
+    services = _local.services
+    service = services.get((name, version))
+    if service is None:
+        # One authorized transport per thread, shared by all its services:
+        # httplib2 keeps a persistent connection per host inside it, and
+        # token refreshes happen once rather than once per service
+        if _local.http is None:
+            _local.http = AuthorizedHttp(credentials, http=httplib2.Http(timeout=_HTTP_TIMEOUT))
+        # The discovery document comes from the copy bundled with
+        # googleapiclient, never from the network
+        service = services[(name, version)] = build(
+            name,
+            version,
+            http=_local.http,
+            cache_discovery=False,
+            static_discovery=True,
+            model=_OrjsonModel() if orjson is not None else None,
+        )
+    return service
+
+
+def get_youtube_service():
+    """Get YouTube Data API service."""
+    return _get_service("youtube", "v3")
+
+
+def get_analytics_service():
+    """Get YouTube Analytics API service."""
+    return _get_service("youtubeAnalytics", "v2")
+
+
+def execute_requests(service, requests: dict) -> dict:
+    """Execute independent requests of one API, batching them if several.
+
+    A single request is executed directly; several are sent as HTTP batch
+    requests of up to _BATCH_SIZE subrequests. One failing request does not
+    affect the others.
+
+    Args:
+        service: Service the requests were built from
+        requests: HttpRequest objects keyed by request ID
+
+    Returns:
+        Each request's response, or the exception it failed with, keyed by
+        request ID
+    """
+    results = {}
+    if len(requests) == 1:
+        (request_id, request), = requests.items()
+        try:
+            results[request_id] = request.execute()
+        except HttpError as e:
+            results[request_id] = e
+        return results
+
+    def collect(request_id, response, exception):
+        results[request_id] = exception if exception is not None else response
+
+    items = list(requests.items())
+    for start in range(0, len(items), _BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=collect)
+        for request_id, request in items[start:start + _BATCH_SIZE]:
+            batch.add(request, request_id=request_id)
+        batch.execute()
+    return results
+
+
+def get_channel_id() -> str:
+    """Get the authenticated user's channel ID.
+
+    Raises:
+        ValueError: If the account has no channel
+    """
+    account = get_auth().cache_namespace()
+    channel_id = _channel_ids.get(account)
+    if channel_id is None:
+        response = get_youtube_service().channels().list(
+            part="id", mine=True, fields="items/id"
+        ).execute()
+        if not response.get("items"):
+            raise ValueError("No channel found for authenticated user")
+        channel_id = _channel_ids[account] = response["items"][0]["id"]
+    return channel_id
@@ -0,0 +1,59 @@
+"""Helpers shared by the response parsers of the tool modules."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator, Optional
+
+# List tools that follow nextPageToken past the first page stop after this
+# many items, which bounds the quota one call can spend
+MAX_PAGED_RESULTS = 500
+
+# Worker threads fetching the next page of a paged list call
+_page_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="yt-pages")
+
+
+def thumbnail_url(snippet: dict) -> str:
+    """Return the high-resolution thumbnail URL of a resource snippet, or ""."""
+    try:
+        return snippet["thumbnails"]["high"]["url"]
+    except KeyError:
+        return ""
+
+
+def fetch_pages(
+    fetch_page: Callable[[Optional[str], int], dict],
+    max_results: int,
+    page_size: int,
+) -> Iterator[dict]:
+    """Yield the responses of a paged list call until max_results items.
+
+    Page tokens are sequential, so pages cannot be requested in parallel, but
+    the next page is requested as soon as a response arrives: it is fetched
+    in the background while the caller parses the page just yielded.
+
+    Args:
+        fetch_page: Called with the page token (None for the first page) and
+            the number of items to request; executes the list request. It
+            runs on a worker thread for every page after the first.
+        max_results: Total number of items wanted
+        page_size: Largest maxResults the API accepts for this call
+    """
+    remaining = max_results
+    response = fetch_page(None, min(page_size, remaining))
+    while True:
+        remaining -= len(response.get("items", []))
+        token = response.get("nextPageToken")
+        pending: Optional[Future] = None
+        if token and remaining > 0:
+            pending = _page_executor.submit(fetch_page, token, min(page_size, remaining))
+        yield response
+        if pending is None:
+            return
+        response = pending.result()
+
+
+def author_channel_id(snippet: dict) -> str:
+    """Return the author channel ID of a comment snippet, or ""."""
+    try:
+        return snippet["authorChannelId"]["value"]
+    except KeyError:
+        return ""
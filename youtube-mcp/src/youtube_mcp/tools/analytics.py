@@ -1,11 +1,13 @@
 """Analytics tools for YouTube MCP Server."""
 
+import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Union
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
+from ..auth import get_auth
+from ..cache import MISSING, TTLCache
 from ..schemas import (
     ChannelStats,
     VideoAnalytics,
@@ -18,26 +20,375 @@ from ..schemas import (
     DeviceStats,
     PlaybackLocation,
     ContentPerformance,
+    ContentPerformanceColumns,
+    VideoBundle,
 )
+from ._client import execute_requests, get_analytics_service, get_youtube_service
 
 
-def _get_youtube_service():
-    """Get YouTube Data API service."""
-    return build("youtube", "v3", credentials=get_credentials())
+# The Data API accepts up to 50 comma-separated IDs per videos.list call
+_MAX_IDS_PER_REQUEST = 50
 
+# Per-video analytics reports return at most 200 rows, so a multi-video query
+# covers at most this many IDs
+_MAX_VIDEOS_PER_QUERY = 200
 
-def _get_analytics_service():
-    """Get YouTube Analytics API service."""
-    return build("youtubeAnalytics", "v2", credentials=get_credentials())
+# Video titles by ID, shared by the reports that list videos. Only the title
+# is requested from videos.list.
+_title_cache = TTLCache(maxsize=4096, ttl=3600)
+_TITLE_FIELDS = "items(id,snippet/title)"
 
+# Partial-response projection of the channel fields get_channel_stats reads
+_CHANNEL_STATS_FIELDS = (
+    "items(id,snippet(title,publishedAt),statistics(subscriberCount,viewCount,videoCount))"
+)
 
-def _get_channel_id() -> str:
-    """Get the authenticated user's channel ID."""
-    youtube = _get_youtube_service()
-    response = youtube.channels().list(part="id", mine=True).execute()
-    if not response.get("items"):
-        raise ValueError("No channel found for authenticated user")
-    return response["items"][0]["id"]
+# Runs the independent report queries of a tool side by side. Each worker
+# thread builds and executes requests on its own service (see _client), since
+# httplib2 connections cannot be shared between threads.
+_query_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="yt-analytics")
+
+# reports.query responses by account and parameters. Reports whose window
+# ends within _RECENT_DAYS are refreshed after _RECENT_TTL seconds; older
+# windows no longer change and are kept for a day.
+_query_cache = TTLCache(maxsize=512)
+_RECENT_DAYS = 3
+_RECENT_TTL = 300
+_HISTORICAL_TTL = 86_400
+
+# Stand-in rows for reports that return no data (e.g. no views in the window)
+_ZERO_ROW_2 = (0,) * 2
+_ZERO_ROW_5 = (0,) * 5
+_ZERO_ROW_9 = (0,) * 9
+
+# ageGroup dimension values, youngest first
+_AGE_BUCKETS = (
+    "age13-17", "age18-24", "age25-34", "age35-44", "age45-54", "age55-64", "age65-",
+)
+
+# gender dimension values reported by demographics queries
+_GENDERS = frozenset({"male", "female", "user_specified"})
+
+
+def _default_date_window(days: int = 28) -> tuple[str, str]:
+    """Get the (start, end) dates (YYYY-MM-DD, UTC) of a window ending today."""
+    now = datetime.now(timezone.utc)
+    return (now - timedelta(days=days)).strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")
+
+
+def _query_key(params: dict) -> str:
+    """Cache key of a reports.query call for the authenticated account."""
+    return get_auth().cache_namespace() + json.dumps(params, sort_keys=True)
+
+
+def _query_ttl(params: dict) -> float:
+    """How long a reports.query response may be reused.
+
+    Reports ending in the last few days still change as data is processed;
+    older windows are final.
+    """
+    recent, _ = _default_date_window(_RECENT_DAYS)
+    return _RECENT_TTL if params.get("endDate", "") >= recent else _HISTORICAL_TTL
+
+
+def _query(**params) -> dict:
+    """Execute a YouTube Analytics reports.query call on this thread's service.
+
+    Responses are cached, so tools sharing a report only fetch it once.
+    """
+    key = _query_key(params)
+    response = _query_cache.get(key)
+    if response is MISSING:
+        response = get_analytics_service().reports().query(**params).execute()
+        _query_cache.set(key, response, _query_ttl(params))
+    return response
+
+
+def _query_batch(queries: dict[str, dict]) -> dict[str, dict]:
+    """Execute several reports.query calls as a single HTTP batch request.
+
+    Cached responses are reused and only the rest are requested. The
+    successful responses are cached even when another query fails, so a
+    retry only requests the failed ones again.
+
+    Args:
+        queries: Keyword arguments of each query, keyed by request ID
+
+    Returns:
+        Responses keyed by request ID
+
+    Raises:
+        HttpError: The first error, if any of the queries failed
+    """
+    responses = {}
+    misses = {}
+    for request_id, params in queries.items():
+        response = _query_cache.get(_query_key(params))
+        if response is MISSING:
+            misses[request_id] = params
+        else:
+            responses[request_id] = response
+
+    if not misses:
+        return responses
+
+    analytics = get_analytics_service()
+    reports = analytics.reports()
+    fetched = execute_requests(analytics, {
+        request_id: reports.query(**params) for request_id, params in misses.items()
+    })
+    errors = []
+    for request_id, response in fetched.items():
+        if isinstance(response, Exception):
+            errors.append(response)
+            continue
+        params = misses[request_id]
+        _query_cache.set(_query_key(params), response, _query_ttl(params))
+        responses[request_id] = response
+    if errors:
+        raise errors[0]
+    return responses
+
+
+def _query_all(*queries: dict) -> list[dict]:
+    """Execute several reports.query calls concurrently.
+
+    Args:
+        queries: Keyword arguments of each query
+
+    Returns:
+        Responses in the order of queries
+    """
+    futures = [_query_executor.submit(_query, **params) for params in queries]
+    return [future.result() for future in futures]
+
+
+def _get_video_titles(youtube, video_ids: list[str]) -> dict[str, str]:
+    """Look up video titles by ID.
+
+    Titles seen in the last hour are answered from memory. The rest are
+    requested 50 per videos.list call; when more than one call is needed they
+    are sent together as a single HTTP batch request. Titles that were
+    fetched are cached even when another call fails.
+
+    Returns:
+        Dict mapping video ID to title
+
+    Raises:
+        HttpError: The first error, if any of the calls failed
+    """
+    titles = {}
+    missing = []
+    for video_id in video_ids:
+        title = _title_cache.get(video_id)
+        if title is MISSING:
+            missing.append(video_id)
+        else:
+            titles[video_id] = title
+    if not missing:
+        return titles
+
+    responses = execute_requests(youtube, {
+        str(start): youtube.videos().list(
+            part="snippet",
+            id=",".join(missing[start:start + _MAX_IDS_PER_REQUEST]),
+            maxResults=_MAX_IDS_PER_REQUEST,
+            fields=_TITLE_FIELDS,
+        )
+        for start in range(0, len(missing), _MAX_IDS_PER_REQUEST)
+    })
+
+    errors = []
+    for response in responses.values():
+        if isinstance(response, Exception):
+            errors.append(response)
+            continue
+        for item in response.get("items", []):
+            titles[item["id"]] = item["snippet"]["title"]
+            _title_cache.set(item["id"], item["snippet"]["title"])
+    if errors:
+        raise errors[0]
+    return titles
+
+
+# Query parameters and response parsing of the per-video reports, shared by
+# the single-report tools and get_video_bundle
+
+def _video_analytics_query(video_id: str, start_date: str, end_date: str) -> dict:
+    return {
+        "ids": "channel==MINE",
+        "startDate": start_date,
+        "endDate": end_date,
+        "metrics": "views,estimatedMinutesWatched,averageViewDuration,likes,dislikes,comments,shares,subscribersGained,subscribersLost",
+        "filters": f"video=={video_id}",
+    }
+
+
+def _retention_summary_query(video_id: str, start_date: str, end_date: str) -> dict:
+    # Average view duration and percentage
+    return {
+        "ids": "channel==MINE",
+        "startDate": start_date,
+        "endDate": end_date,
+        "metrics": "averageViewDuration,averageViewPercentage",
+        "filters": f"video=={video_id}",
+    }
+
+
+def _retention_curve_query(video_id: str, start_date: str, end_date: str) -> dict:
+    # Retention curve (audienceWatchRatio by elapsedVideoTimeRatio)
+    return {
+        "ids": "channel==MINE",
+        "startDate": start_date,
+        "endDate": end_date,
+        "metrics": "audienceWatchRatio",
+        "dimensions": "elapsedVideoTimeRatio",
+        "filters": f"video=={video_id}",
+        "sort": "elapsedVideoTimeRatio",
+    }
+
+
+def _breakdown_query(
+    dimension: str, video_id: Optional[str], start_date: str, end_date: str
+) -> dict:
+    # Views and watch time by one dimension, channel-wide or for one video
+    query_params = {
+        "ids": "channel==MINE",
+        "startDate": start_date,
+        "endDate": end_date,
+        "metrics": "views,estimatedMinutesWatched",
+        "dimensions": dimension,
+        "sort": "-views",
+    }
+    if video_id:
+        query_params["filters"] = f"video=={video_id}"
+    return query_params
+
+
+def _videos_analytics_query(video_ids: list[str], start_date: str, end_date: str) -> dict:
+    # Per-video reports must be sorted and limited (at most 200 rows)
+    return {
+        **_video_analytics_query(",".join(video_ids), start_date, end_date),
+        "dimensions": "video",
+        "sort": "-views",
+        "maxResults": len(video_ids),
+    }
+
+
+def _make_row_parser(model, field_specs: tuple):
+    """Get a function that converts a report row into a model.
+
+    The function is generated once per spec as straight-line code, e.g.
+    ``Model(views=convert_0(row[0]), ..., **extra)``, so converting a row does
+    not loop over the spec. Fields not taken from the row are passed to it as
+    keyword arguments.
+
+    Args:
+        model: Pydantic model class to construct
+        field_specs: (field name, converter, row index) of each field read
+            from the row
+
+    Returns:
+        Function taking (row, **extra) and returning a model instance
+    """
+    key = (model, field_specs)
+    parser = _row_parsers.get(key)
+    if parser is None:
+        namespace = {"Model": model}
+        arguments = []
+        for i, (name, convert, index) in enumerate(field_specs):
+            namespace[f"convert_{i}"] = convert
+            arguments.append(f"{name}=convert_{i}(row[{index}])")
+        source = f"def parse(row, **extra):\n    return Model({', '.join(arguments)}, **extra)\n"
+        exec(compile(source, f"<{model.__name__} row parser>", "exec"), namespace)
+        parser = _row_parsers[key] = namespace["parse"]
+    return parser
+
+
+_row_parsers: dict = {}
+
+# Row layout of _video_analytics_query (after the video ID in per-video reports)
+_video_analytics_from_row = _make_row_parser(VideoAnalytics, (
+    ("views", int, 0),
+    ("estimated_minutes_watched", float, 1),
+    ("average_view_duration", float, 2),
+    ("likes", int, 3),
+    ("dislikes", int, 4),
+    ("comments", int, 5),
+    ("shares", int, 6),
+    ("subscribers_gained", int, 7),
+    ("subscribers_lost", int, 8),
+))
+
+# Row layout of the get_content_performance report
+_content_performance_from_row = _make_row_parser(ContentPerformance, (
+    ("video_id", str, 0),
+    ("views", int, 1),
+    ("estimated_minutes_watched", float, 2),
+    ("average_view_duration", float, 3),
+    ("likes", int, 4),
+    ("comments", int, 5),
+    ("shares", int, 6),
+    ("subscribers_gained", int, 7),
+))
+
+
+def _parse_video_analytics(video_id: str, response: dict) -> VideoAnalytics:
+    rows = response.get("rows")
+    return _video_analytics_from_row(rows[0] if rows else _ZERO_ROW_9, video_id=video_id)
+
+
+def _parse_audience_retention(
+    video_id: str, summary_response: dict, retention_response: dict
+) -> AudienceRetention:
+    summary_rows = summary_response.get("rows")
+    summary_row = summary_rows[0] if summary_rows else _ZERO_ROW_2
+
+    retention_data = []
+    for row in retention_response.get("rows", []):
+        retention_data.append({
+            "elapsed_ratio": float(row[0]),
+            "retention_percentage": float(row[1]) * 100,
+        })
+
+    return AudienceRetention(
+        video_id=video_id,
+        average_view_duration_seconds=float(summary_row[0]),
+        average_view_percentage=float(summary_row[1]),
+        retention_data=retention_data,
+    )
+
+
+def _parse_traffic_sources(response: dict) -> list[TrafficSource]:
+    # Coerce each row once, then calculate total views for percentage (all
+    # percentages are 0 when there are no views)
+    parsed = [(row[0], int(row[1]), float(row[2])) for row in response.get("rows", [])]
+    total_views = sum(views for _, views, _ in parsed) or 1
+
+    return [
+        TrafficSource(
+            source_type=source_type,
+            views=views,
+            watch_time_minutes=watch_time,
+            percentage=round(views * 100 / total_views, 2),
+        )
+        for source_type, views, watch_time in parsed
+    ]
+
+
+def _parse_device_stats(response: dict) -> list[DeviceStats]:
+    parsed = [(row[0], int(row[1]), float(row[2])) for row in response.get("rows", [])]
+    total_views = sum(views for _, views, _ in parsed) or 1
+
+    return [
+        DeviceStats(
+            device_type=device_type,
+            views=views,
+            estimated_minutes_watched=minutes,
+            percentage=round(views * 100 / total_views, 2),
+        )
+        for device_type, views, minutes in parsed
+    ]
 
 
 def get_channel_stats() -> ChannelStats:
@@ -46,11 +397,12 @@ def get_channel_stats() -> ChannelStats:
     Returns:
         ChannelStats with subscriber count, view count, video count, etc.
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     response = youtube.channels().list(
         part="snippet,statistics",
         mine=True,
+        fields=_CHANNEL_STATS_FIELDS,
     ).execute()
 
     if not response.get("items"):
@@ -85,37 +437,57 @@ def get_video_analytics(
     Returns:
         VideoAnalytics with views, watch time, likes, comments, etc.
     """
-    analytics = _get_analytics_service()
-
     # Default date range: last 28 days
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    response = analytics.reports().query(
-        ids=f"channel==MINE",
-        startDate=start_date,
-        endDate=end_date,
-        metrics="views,estimatedMinutesWatched,averageViewDuration,likes,dislikes,comments,shares,subscribersGained,subscribersLost",
-        filters=f"video=={video_id}",
-    ).execute()
+    response = _query(**_video_analytics_query(video_id, start_date, end_date))
 
-    rows = response.get("rows", [[0] * 9])
-    row = rows[0] if rows else [0] * 9
+    return _parse_video_analytics(video_id, response)
 
-    return VideoAnalytics(
-        video_id=video_id,
-        views=int(row[0]),
-        estimated_minutes_watched=float(row[1]),
-        average_view_duration=float(row[2]),
-        likes=int(row[3]),
-        dislikes=int(row[4]),
-        comments=int(row[5]),
-        shares=int(row[6]),
-        subscribers_gained=int(row[7]),
-        subscribers_lost=int(row[8]),
-    )
+
+def get_videos_analytics(
+    video_ids: list[str],
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> list[VideoAnalytics]:
+    """Get analytics for several videos at once.
+
+    Up to 200 videos are covered by a single report query (filtered on all
+    of their IDs); larger lists are split and the queries sent as one HTTP
+    batch request.
+
+    Args:
+        video_ids: YouTube video IDs
+        start_date: Start date (YYYY-MM-DD), defaults to 28 days ago
+        end_date: End date (YYYY-MM-DD), defaults to today
+
+    Returns:
+        VideoAnalytics for each requested video, in the order given (all
+        zero for videos without data in the window)
+    """
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
+
+    unique_ids = list(dict.fromkeys(video_ids))
+    responses = _query_batch({
+        str(start): _videos_analytics_query(
+            unique_ids[start:start + _MAX_VIDEOS_PER_QUERY], start_date, end_date
+        )
+        for start in range(0, len(unique_ids), _MAX_VIDEOS_PER_QUERY)
+    })
+
+    rows = {
+        row[0]: row[1:]
+        for response in responses.values()
+        for row in response.get("rows", [])
+    }
+    return [
+        _video_analytics_from_row(rows.get(video_id, _ZERO_ROW_9), video_id=video_id)
+        for video_id in video_ids
+    ]
 
 
 def get_audience_retention(
@@ -125,6 +497,8 @@ def get_audience_retention(
 ) -> AudienceRetention:
     """Get audience retention data for a video.
 
+    Both reports are fetched in a single HTTP batch request.
+
     Args:
         video_id: YouTube video ID
         start_date: Start date (YYYY-MM-DD), defaults to 28 days ago
@@ -133,47 +507,54 @@ def get_audience_retention(
     Returns:
         AudienceRetention with retention curve data
     """
-    analytics = _get_analytics_service()
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
+    responses = _query_batch({
+        "summary": _retention_summary_query(video_id, start_date, end_date),
+        "curve": _retention_curve_query(video_id, start_date, end_date),
+    })
 
-    # Get average view duration and percentage
-    summary_response = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date,
-        endDate=end_date,
-        metrics="averageViewDuration,averageViewPercentage",
-        filters=f"video=={video_id}",
-    ).execute()
+    return _parse_audience_retention(video_id, responses["summary"], responses["curve"])
 
-    summary_row = summary_response.get("rows", [[0, 0]])[0]
 
-    # Get retention curve (audienceWatchRatio by elapsedVideoTimeRatio)
-    retention_response = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date,
-        endDate=end_date,
-        metrics="audienceWatchRatio",
-        dimensions="elapsedVideoTimeRatio",
-        filters=f"video=={video_id}",
-        sort="elapsedVideoTimeRatio",
-    ).execute()
+def get_video_bundle(
+    video_id: str,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> VideoBundle:
+    """Get the main analytics reports of a video in one round trip.
 
-    retention_data = []
-    for row in retention_response.get("rows", []):
-        retention_data.append({
-            "elapsed_ratio": float(row[0]),
-            "retention_percentage": float(row[1]) * 100,
-        })
+    The summary, retention, traffic source and device reports are sent as a
+    single HTTP batch request instead of five separate calls.
 
-    return AudienceRetention(
+    Args:
+        video_id: YouTube video ID
+        start_date: Start date (YYYY-MM-DD), defaults to 28 days ago
+        end_date: End date (YYYY-MM-DD), defaults to today
+
+    Returns:
+        VideoBundle with analytics, retention, traffic sources and devices
+    """
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
+
+    responses = _query_batch({
+        "analytics": _video_analytics_query(video_id, start_date, end_date),
+        "summary": _retention_summary_query(video_id, start_date, end_date),
+        "curve": _retention_curve_query(video_id, start_date, end_date),
+        "traffic": _breakdown_query("insightTrafficSourceType", video_id, start_date, end_date),
+        "devices": _breakdown_query("deviceType", video_id, start_date, end_date),
+    })
+
+    return VideoBundle(
         video_id=video_id,
-        average_view_duration_seconds=float(summary_row[0]),
-        average_view_percentage=float(summary_row[1]),
-        retention_data=retention_data,
+        analytics=_parse_video_analytics(video_id, responses["analytics"]),
+        retention=_parse_audience_retention(video_id, responses["summary"], responses["curve"]),
+        traffic_sources=_parse_traffic_sources(responses["traffic"]),
+        devices=_parse_device_stats(responses["devices"]),
     )
 
 
@@ -192,45 +573,15 @@ def get_traffic_sources(
     Returns:
         List of TrafficSource objects
     """
-    analytics = _get_analytics_service()
-
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
-
-    query_params = {
-        "ids": "channel==MINE",
-        "startDate": start_date,
-        "endDate": end_date,
-        "metrics": "views,estimatedMinutesWatched",
-        "dimensions": "insightTrafficSourceType",
-        "sort": "-views",
-    }
-
-    if video_id:
-        query_params["filters"] = f"video=={video_id}"
-
-    response = analytics.reports().query(**query_params).execute()
-
-    # Calculate total views for percentage
-    total_views = sum(int(row[1]) for row in response.get("rows", []))
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    sources = []
-    for row in response.get("rows", []):
-        source_type = row[0]
-        views = int(row[1])
-        watch_time = float(row[2])
-        percentage = (views / total_views * 100) if total_views > 0 else 0
-
-        sources.append(TrafficSource(
-            source_type=source_type,
-            views=views,
-            watch_time_minutes=watch_time,
-            percentage=round(percentage, 2),
-        ))
+    response = _query(
+        **_breakdown_query("insightTrafficSourceType", video_id, start_date, end_date)
+    )
 
-    return sources
+    return _parse_traffic_sources(response)
 
 
 def get_demographics(
@@ -246,66 +597,54 @@ def get_demographics(
     Returns:
         Demographics with age, gender, and geographic distribution
     """
-    analytics = _get_analytics_service()
-
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
-
-    # Get age and gender breakdown
-    age_gender_response = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date,
-        endDate=end_date,
-        metrics="viewerPercentage",
-        dimensions="ageGroup,gender",
-    ).execute()
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
+
+    age_gender_response, country_response = _query_all(
+        # Age and gender breakdown
+        dict(
+            ids="channel==MINE",
+            startDate=start_date,
+            endDate=end_date,
+            metrics="viewerPercentage",
+            dimensions="ageGroup,gender",
+        ),
+        # Country breakdown
+        dict(
+            ids="channel==MINE",
+            startDate=start_date,
+            endDate=end_date,
+            metrics="views",
+            dimensions="country",
+            sort="-views",
+            maxResults=10,
+        ),
+    )
 
-    # Process age groups
-    age_totals = {}
-    gender_totals = {"male": 0, "female": 0, "user_specified": 0}
+    # Aggregate by age group and by gender
+    # Known age groups come first, in display order; unexpected ones follow
+    age_totals = defaultdict(float, dict.fromkeys(_AGE_BUCKETS, 0.0))
+    gender_totals = dict.fromkeys(_GENDERS, 0.0)
 
     for row in age_gender_response.get("rows", []):
-        age_group = row[0]
-        gender = row[1]
-        percentage = float(row[2])
-
-        # Aggregate by age group
-        if age_group not in age_totals:
-            age_totals[age_group] = 0
+        age_group, gender, percentage = row[0], row[1], float(row[2])
         age_totals[age_group] += percentage
-
-        # Aggregate by gender
-        if gender in gender_totals:
+        if gender in _GENDERS:
             gender_totals[gender] += percentage
 
     age_groups = [
         {"age_group": k, "percentage": round(v, 2)}
-        for k, v in sorted(age_totals.items())
+        for k, v in age_totals.items()
+        if v
     ]
 
-    # Get country breakdown
-    country_response = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date,
-        endDate=end_date,
-        metrics="views",
-        dimensions="country",
-        sort="-views",
-        maxResults=10,
-    ).execute()
-
-    total_country_views = sum(int(row[1]) for row in country_response.get("rows", []))
-    top_countries = []
-    for row in country_response.get("rows", []):
-        country = row[0]
-        views = int(row[1])
-        percentage = (views / total_country_views * 100) if total_country_views > 0 else 0
-        top_countries.append({
-            "country": country,
-            "percentage": round(percentage, 2),
-        })
+    country_views = [(row[0], int(row[1])) for row in country_response.get("rows", [])]
+    total_country_views = sum(views for _, views in country_views) or 1
+    top_countries = [
+        {"country": country, "percentage": round(views * 100 / total_country_views, 2)}
+        for country, views in country_views
+    ]
 
     return Demographics(
         age_groups=age_groups,
@@ -333,8 +672,7 @@ def get_top_videos(
     Returns:
         List of TopVideo objects
     """
-    analytics = _get_analytics_service()
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     # Map friendly metric names
     metric_map = {
@@ -346,10 +684,9 @@ def get_top_videos(
     }
     api_metric = metric_map.get(metric, "views")
 
-    end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    start_date = (datetime.now(timezone.utc) - timedelta(days=period_days)).strftime("%Y-%m-%d")
+    start_date, end_date = _default_date_window(period_days)
 
-    response = analytics.reports().query(
+    response = _query(
         ids="channel==MINE",
         startDate=start_date,
         endDate=end_date,
@@ -357,40 +694,26 @@ def get_top_videos(
         dimensions="video",
         sort=f"-{api_metric}",
         maxResults=limit,
-    ).execute()
+    )
 
     video_ids = [row[0] for row in response.get("rows", [])]
     if not video_ids:
         return []
 
-    # Get video titles
-    videos_response = youtube.videos().list(
-        part="snippet",
-        id=",".join(video_ids),
-    ).execute()
-
-    title_map = {
-        item["id"]: item["snippet"]["title"]
-        for item in videos_response.get("items", [])
-    }
+    title_map = _get_video_titles(youtube, video_ids)
 
     # Map metrics index
     metric_index = {"views": 1, "estimatedMinutesWatched": 2, "likes": 3, "comments": 4}
 
-    top_videos = []
-    for row in response.get("rows", []):
-        video_id = row[0]
-        top_videos.append(TopVideo(
-            video_id=video_id,
-            title=title_map.get(video_id, "Unknown"),
-            metric_value=float(row[metric_index.get(api_metric, 1)]),
-            views=int(row[1]),
-            watch_time_minutes=float(row[2]),
-            likes=int(row[3]),
-            comments=int(row[4]),
-        ))
-
-    return top_videos
+    parse = _make_row_parser(TopVideo, (
+        ("video_id", str, 0),
+        ("metric_value", float, metric_index.get(api_metric, 1)),
+        ("views", int, 1),
+        ("watch_time_minutes", float, 2),
+        ("likes", int, 3),
+        ("comments", int, 4),
+    ))
+    return [parse(row, title=title_map.get(row[0], "Unknown")) for row in response["rows"]]
 
 
 def get_revenue_report(
@@ -410,45 +733,33 @@ def get_revenue_report(
         This requires the channel to have monetization enabled and
         the yt-analytics-monetary.readonly scope.
     """
-    analytics = _get_analytics_service()
-
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    response = analytics.reports().query(
+    # Views are fetched alongside revenue for the RPM calculation
+    response = _query(
         ids="channel==MINE",
         startDate=start_date,
         endDate=end_date,
-        metrics="estimatedRevenue,estimatedAdRevenue,cpm,playbackBasedCpm",
+        metrics="views,estimatedRevenue,estimatedAdRevenue,cpm,playbackBasedCpm",
         currency="USD",
-    ).execute()
-
-    rows = response.get("rows", [[0, 0, 0, 0]])
-    row = rows[0] if rows else [0, 0, 0, 0]
+    )
 
-    # Calculate RPM (Revenue per Mille)
-    # RPM = (Total Revenue / Views) * 1000
-    # We need to get views separately
-    views_response = analytics.reports().query(
-        ids="channel==MINE",
-        startDate=start_date,
-        endDate=end_date,
-        metrics="views",
-    ).execute()
+    rows = response.get("rows")
+    row = rows[0] if rows else _ZERO_ROW_5
 
-    views_rows = views_response.get("rows", [[0]])
-    views = int(views_rows[0][0]) if views_rows else 0
-    estimated_revenue = float(row[0])
+    # RPM (Revenue per Mille) = (Total Revenue / Views) * 1000
+    views = int(row[0])
+    estimated_revenue = float(row[1])
     rpm = (estimated_revenue / views * 1000) if views > 0 else 0
 
     return RevenueReport(
         estimated_revenue=estimated_revenue,
-        estimated_ad_revenue=float(row[1]),
-        cpm=float(row[2]),
+        estimated_ad_revenue=float(row[2]),
+        cpm=float(row[3]),
         rpm=round(rpm, 2),
-        playback_based_cpm=float(row[3]),
+        playback_based_cpm=float(row[4]),
     )
 
 
@@ -467,40 +778,13 @@ def get_device_analytics(
     Returns:
         List of DeviceStats objects
     """
-    analytics = _get_analytics_service()
-
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
-
-    query_params = {
-        "ids": "channel==MINE",
-        "startDate": start_date,
-        "endDate": end_date,
-        "metrics": "views,estimatedMinutesWatched",
-        "dimensions": "deviceType",
-        "sort": "-views",
-    }
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    if video_id:
-        query_params["filters"] = f"video=={video_id}"
-
-    response = analytics.reports().query(**query_params).execute()
-
-    total_views = sum(int(row[1]) for row in response.get("rows", []))
+    response = _query(**_breakdown_query("deviceType", video_id, start_date, end_date))
 
-    devices = []
-    for row in response.get("rows", []):
-        views = int(row[1])
-        devices.append(DeviceStats(
-            device_type=row[0],
-            views=views,
-            estimated_minutes_watched=float(row[2]),
-            percentage=round((views / total_views * 100) if total_views > 0 else 0, 2),
-        ))
-
-    return devices
+    return _parse_device_stats(response)
 
 
 def get_playback_locations(
@@ -518,67 +802,54 @@ def get_playback_locations(
     Returns:
         List of PlaybackLocation objects
     """
-    analytics = _get_analytics_service()
-
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
-
-    query_params = {
-        "ids": "channel==MINE",
-        "startDate": start_date,
-        "endDate": end_date,
-        "metrics": "views,estimatedMinutesWatched",
-        "dimensions": "insightPlaybackLocationType",
-        "sort": "-views",
-    }
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    if video_id:
-        query_params["filters"] = f"video=={video_id}"
-
-    response = analytics.reports().query(**query_params).execute()
+    response = _query(
+        **_breakdown_query("insightPlaybackLocationType", video_id, start_date, end_date)
+    )
 
-    total_views = sum(int(row[1]) for row in response.get("rows", []))
+    parsed = [(row[0], int(row[1]), float(row[2])) for row in response.get("rows", [])]
+    total_views = sum(views for _, views, _ in parsed) or 1
 
-    locations = []
-    for row in response.get("rows", []):
-        views = int(row[1])
-        locations.append(PlaybackLocation(
-            playback_location_type=row[0],
+    return [
+        PlaybackLocation(
+            playback_location_type=location_type,
             views=views,
-            estimated_minutes_watched=float(row[2]),
-            percentage=round((views / total_views * 100) if total_views > 0 else 0, 2),
-        ))
-
-    return locations
+            estimated_minutes_watched=minutes,
+            percentage=round(views * 100 / total_views, 2),
+        )
+        for location_type, views, minutes in parsed
+    ]
 
 
 def get_content_performance(
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     max_results: int = 25,
-) -> list[ContentPerformance]:
+    columnar: bool = False,
+) -> Union[list[ContentPerformance], ContentPerformanceColumns]:
     """Get detailed performance metrics for each video.
 
     Args:
         start_date: Start date (YYYY-MM-DD)
         end_date: End date (YYYY-MM-DD)
         max_results: Maximum number of videos to return (1-50)
+        columnar: Return one list per metric instead of one object per video
 
     Returns:
-        List of ContentPerformance objects
+        List of ContentPerformance objects, or ContentPerformanceColumns if
+        columnar is set
     """
     max_results = max(1, min(50, max_results))
-    analytics = _get_analytics_service()
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
-    if not end_date:
-        end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    if not start_date:
-        start_date = (datetime.now(timezone.utc) - timedelta(days=28)).strftime("%Y-%m-%d")
+    default_start, default_end = _default_date_window()
+    start_date = start_date or default_start
+    end_date = end_date or default_end
 
-    response = analytics.reports().query(
+    response = _query(
         ids="channel==MINE",
         startDate=start_date,
         endDate=end_date,
@@ -586,36 +857,29 @@ def get_content_performance(
         dimensions="video",
         sort="-views",
         maxResults=max_results,
-    ).execute()
+    )
 
     video_ids = [row[0] for row in response.get("rows", [])]
     if not video_ids:
-        return []
-
-    # Get video titles
-    videos_response = youtube.videos().list(
-        part="snippet",
-        id=",".join(video_ids),
-    ).execute()
-
-    title_map = {
-        item["id"]: item["snippet"]["title"]
-        for item in videos_response.get("items", [])
-    }
-
-    results = []
-    for row in response.get("rows", []):
-        vid = row[0]
-        results.append(ContentPerformance(
-            video_id=vid,
-            title=title_map.get(vid, "Unknown"),
-            views=int(row[1]),
-            estimated_minutes_watched=float(row[2]),
-            average_view_duration=float(row[3]),
-            likes=int(row[4]),
-            comments=int(row[5]),
-            shares=int(row[6]),
-            subscribers_gained=int(row[7]),
-        ))
-
-    return results
+        return ContentPerformanceColumns() if columnar else []
+
+    title_map = _get_video_titles(youtube, video_ids)
+
+    if columnar:
+        columns = list(zip(*response["rows"]))
+        return ContentPerformanceColumns(
+            video_ids=video_ids,
+            titles=[title_map.get(vid, "Unknown") for vid in video_ids],
+            views=[int(value) for value in columns[1]],
+            estimated_minutes_watched=[float(value) for value in columns[2]],
+            average_view_duration=[float(value) for value in columns[3]],
+            likes=[int(value) for value in columns[4]],
+            comments=[int(value) for value in columns[5]],
+            shares=[int(value) for value in columns[6]],
+            subscribers_gained=[int(value) for value in columns[7]],
+        )
+
+    return [
+        _content_performance_from_row(row, title=title_map.get(row[0], "Unknown"))
+        for row in response["rows"]
+    ]
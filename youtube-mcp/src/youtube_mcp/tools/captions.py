@@ -1,18 +1,72 @@
 """Caption management tools for YouTube MCP Server."""
 
 import io
-from typing import Optional
+import os
+from typing import BinaryIO, Optional, Union
 
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 
-from ..auth import get_credentials
 from ..schemas import CaptionInfo, CaptionFormat
+from ._client import get_youtube_service
 
+# download_caption formats by value
+_CAPTION_FORMATS = {f.value: f for f in CaptionFormat}
 
-def _get_youtube_service():
-    """Get YouTube Data API service."""
-    return build("youtube", "v3", credentials=get_credentials())
+# Partial-response projection of the caption fields _parse_caption reads
+_CAPTION_FIELDS = "items(id,snippet(language,name,isAutoSynced,isDraft,trackKind,lastUpdated))"
+
+# Captions larger than one chunk are sent as a resumable upload in chunks of
+# this size; smaller ones go in a single request, saving the extra round trip
+# that starts a resumable session.
+_CAPTION_CHUNK_SIZE = 256 * 1024
+
+# Leading bytes inspected to recognise a WebVTT header (after a BOM or blank
+# lines)
+_SNIFF_BYTES = 64
+
+
+def _caption_media(
+    body: Union[str, bytes, None],
+    file_path: Optional[str],
+    file_obj: Optional[BinaryIO] = None,
+):
+    """Build the media upload for caption content.
+
+    WebVTT content is labelled text/vtt so the server need not sniff the
+    format; SRT and SBV have no registered type and are sent as binary.
+
+    Args:
+        body: Caption content as text, or as UTF-8 bytes (sent as is)
+        file_path: Path to a caption file
+        file_obj: Seekable binary stream positioned at the start of the
+            content, uploaded without copying it into memory
+
+    Returns:
+        MediaUpload, or None if no content is given
+    """
+    if file_path:
+        is_vtt = os.path.splitext(file_path)[1].lower() == ".vtt"
+        return MediaFileUpload(
+            file_path,
+            mimetype="text/vtt" if is_vtt else "application/octet-stream",
+            chunksize=_CAPTION_CHUNK_SIZE,
+            resumable=os.path.getsize(file_path) > _CAPTION_CHUNK_SIZE,
+        )
+    if file_obj is None:
+        if body is None:
+            return None
+        file_obj = io.BytesIO(body.encode("utf-8") if isinstance(body, str) else body)
+
+    head = file_obj.read(_SNIFF_BYTES)
+    size = file_obj.seek(0, io.SEEK_END)
+    file_obj.seek(0)
+    is_vtt = head.lstrip(b"\xef\xbb\xbf \t\r\n").startswith(b"WEBVTT")
+    return MediaIoBaseUpload(
+        file_obj,
+        mimetype="text/vtt" if is_vtt else "application/octet-stream",
+        chunksize=_CAPTION_CHUNK_SIZE,
+        resumable=size > _CAPTION_CHUNK_SIZE,
+    )
 
 
 def _parse_caption(item: dict, video_id: str) -> CaptionInfo:
@@ -39,11 +93,12 @@ def list_captions(video_id: str) -> list[CaptionInfo]:
     Returns:
         List of CaptionInfo objects
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     response = youtube.captions().list(
         part="snippet",
         videoId=video_id,
+        fields=_CAPTION_FIELDS,
     ).execute()
 
     return [_parse_caption(item, video_id) for item in response.get("items", [])]
@@ -53,26 +108,31 @@ def upload_caption(
     video_id: str,
     language: str,
     name: str = "",
-    body: str = "",
+    body: Union[str, bytes] = "",
     file_path: Optional[str] = None,
     is_draft: bool = False,
+    file_obj: Optional[BinaryIO] = None,
 ) -> CaptionInfo:
     """Upload a caption track for a video.
 
-    Provide caption content via either `body` (raw caption text) or `file_path`.
+    Provide caption content via `body` (raw caption text), `file_path`, or
+    `file_obj`.
 
     Args:
         video_id: YouTube video ID
         language: BCP-47 language code (e.g., 'en', 'es', 'fr')
         name: Caption track name (e.g., 'English CC')
-        body: Caption content as string (SRT, SBV, or VTT format)
+        body: Caption content (SRT, SBV, or VTT format) as a string, or as
+            UTF-8 bytes which are sent without re-encoding
         file_path: Path to caption file (alternative to body)
         is_draft: Whether the caption is a draft
+        file_obj: Seekable binary stream of caption content (alternative to
+            body), streamed without an intermediate buffer
 
     Returns:
         CaptionInfo for the uploaded caption
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     caption_body = {
         "snippet": {
@@ -83,15 +143,9 @@ def upload_caption(
         },
     }
 
-    if file_path:
-        media = MediaFileUpload(file_path, mimetype="application/octet-stream")
-    elif body:
-        media = MediaIoBaseUpload(
-            io.BytesIO(body.encode("utf-8")),
-            mimetype="application/octet-stream",
-        )
-    else:
-        raise ValueError("Either body or file_path must be provided")
+    media = _caption_media(body or None, file_path, file_obj)
+    if media is None:
+        raise ValueError("Either body, file_path or file_obj must be provided")
 
     response = youtube.captions().insert(
         part="snippet",
@@ -107,8 +161,9 @@ def update_caption(
     video_id: str = "",
     name: Optional[str] = None,
     is_draft: Optional[bool] = None,
-    body: Optional[str] = None,
+    body: Union[str, bytes, None] = None,
     file_path: Optional[str] = None,
+    file_obj: Optional[BinaryIO] = None,
 ) -> CaptionInfo:
     """Update an existing caption track.
 
@@ -117,13 +172,14 @@ def update_caption(
         video_id: YouTube video ID (for response only)
         name: New caption track name (optional)
         is_draft: New draft status (optional)
-        body: New caption content as string (optional)
+        body: New caption content as a string or UTF-8 bytes (optional)
         file_path: Path to new caption file (optional)
+        file_obj: Seekable binary stream of new caption content (optional)
 
     Returns:
         Updated CaptionInfo
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     caption_body = {
         "id": caption_id,
@@ -143,13 +199,9 @@ def update_caption(
         "body": caption_body,
     }
 
-    if file_path:
-        kwargs["media_body"] = MediaFileUpload(file_path, mimetype="application/octet-stream")
-    elif body is not None:
-        kwargs["media_body"] = MediaIoBaseUpload(
-            io.BytesIO(body.encode("utf-8")),
-            mimetype="application/octet-stream",
-        )
+    media = _caption_media(body, file_path, file_obj)
+    if media is not None:
+        kwargs["media_body"] = media
 
     response = youtube.captions().update(**kwargs).execute()
 
@@ -169,12 +221,9 @@ def download_caption(
     Returns:
         Caption content as string
     """
-    try:
-        caption_format = CaptionFormat(fmt.lower())
-    except ValueError:
-        caption_format = CaptionFormat.SRT
+    caption_format = _CAPTION_FORMATS.get(fmt.lower(), CaptionFormat.SRT)
 
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     response = youtube.captions().download(
         id=caption_id,
@@ -195,6 +244,6 @@ def delete_caption(caption_id: str) -> bool:
     Returns:
         True if deletion was successful
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
     youtube.captions().delete(id=caption_id).execute()
     return True
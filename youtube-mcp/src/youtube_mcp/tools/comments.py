@@ -1,11 +1,84 @@
 """YouTube Comments tools for reading, replying, and moderating comments."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from ..auth import get_credentials
+from ._client import execute_requests, get_channel_id, get_youtube_service
+from ._common import MAX_PAGED_RESULTS, author_channel_id, fetch_pages
+
+# Comment IDs per comments.setModerationStatus call
+_MODERATION_IDS_PER_REQUEST = 50
+
+# Largest maxResults accepted by commentThreads.list
+_COMMENT_PAGE_SIZE = 100
+
+# Statuses accepted by comments.setModerationStatus
+_MODERATION_STATUSES = frozenset({"published", "heldForReview", "rejected"})
+
+# Partial-response projection of the comment thread fields list_comments reads
+_COMMENT_THREAD_FIELDS = (
+    "nextPageToken,items(id,snippet(totalReplyCount,topLevelComment(id,snippet("
+    "authorDisplayName,authorChannelId,textDisplay,likeCount,publishedAt,updatedAt))))"
+)
+# Partial-response projection of the reply fields get_comment_replies reads
+_REPLY_FIELDS = (
+    "items(id,snippet(authorDisplayName,authorChannelId,textDisplay,likeCount,publishedAt))"
+)
+# Partial-response projection of the thread fields list_held_comments reads
+_HELD_COMMENT_THREAD_FIELDS = (
+    "items(id,snippet(videoId,totalReplyCount,topLevelComment(id,snippet("
+    "authorDisplayName,authorChannelId,textDisplay,likeCount,publishedAt))))"
+)
+
+
+def iter_comments(
+    video_id: str,
+    max_results: int = MAX_PAGED_RESULTS,
+    order: str = "time",
+) -> Iterator[dict]:
+    """Yield top-level comments on a video, fetching pages as they are consumed.
+
+    Stopping early saves the remaining pages, apart from the one already
+    being fetched in the background (see fetch_pages).
+
+    Args:
+        video_id: YouTube video ID
+        max_results: Maximum number of comment threads to yield (1-500)
+        order: Sort order ('time' for newest first, 'relevance' for top comments)
+
+    Yields:
+        Comment dicts as returned by list_comments
+    """
+    max_results = max(1, min(MAX_PAGED_RESULTS, max_results))
+
+    def fetch_page(page_token: Optional[str], page_size: int) -> dict:
+        return get_youtube_service().commentThreads().list(
+            part="snippet",
+            videoId=video_id,
+            maxResults=page_size,
+            order=order,
+            textFormat="plainText",
+            pageToken=page_token,
+            fields=_COMMENT_THREAD_FIELDS,
+        ).execute()
+
+    for response in fetch_pages(fetch_page, max_results, _COMMENT_PAGE_SIZE):
+        for item in response.get("items", []):
+            thread = item["snippet"]
+            comment = thread["topLevelComment"]
+            snippet = comment["snippet"]
+            yield {
+                "comment_id": comment["id"],
+                "thread_id": item["id"],
+                "author": snippet["authorDisplayName"],
+                "author_channel_id": author_channel_id(snippet),
+                "text": snippet["textDisplay"],
+                "like_count": snippet.get("likeCount", 0),
+                "published_at": snippet["publishedAt"],
+                "updated_at": snippet.get("updatedAt", snippet["publishedAt"]),
+                "reply_count": thread["totalReplyCount"],
+            }
 
 
 def list_comments(
@@ -17,40 +90,14 @@ def list_comments(
 
     Args:
         video_id: YouTube video ID
-        max_results: Maximum number of comment threads to return (1-100)
+        max_results: Maximum number of comment threads to return (1-500);
+            more than 100 are fetched over several pages
         order: Sort order ('time' for newest first, 'relevance' for top comments)
 
     Returns:
         List of comment dicts with id, author, text, likes, published_at, reply_count
     """
-    max_results = max(1, min(100, max_results))
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
-
-    response = youtube.commentThreads().list(
-        part="snippet",
-        videoId=video_id,
-        maxResults=max_results,
-        order=order,
-        textFormat="plainText",
-    ).execute()
-
-    comments = []
-    for item in response.get("items", []):
-        snippet = item["snippet"]["topLevelComment"]["snippet"]
-        comments.append({
-            "comment_id": item["snippet"]["topLevelComment"]["id"],
-            "thread_id": item["id"],
-            "author": snippet["authorDisplayName"],
-            "author_channel_id": snippet.get("authorChannelId", {}).get("value", ""),
-            "text": snippet["textDisplay"],
-            "like_count": snippet.get("likeCount", 0),
-            "published_at": snippet["publishedAt"],
-            "updated_at": snippet.get("updatedAt", snippet["publishedAt"]),
-            "reply_count": item["snippet"]["totalReplyCount"],
-        })
-
-    return comments
+    return list(iter_comments(video_id, max_results, order))
 
 
 def reply_to_comment(
@@ -67,8 +114,7 @@ def reply_to_comment(
         Dict with reply details
     """
     text = text[:10000]
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     response = youtube.comments().insert(
         part="snippet",
@@ -104,24 +150,25 @@ def get_comment_replies(
         List of reply dicts
     """
     max_results = max(1, min(100, max_results))
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     response = youtube.comments().list(
         part="snippet",
         parentId=comment_id,
         maxResults=max_results,
         textFormat="plainText",
+        fields=_REPLY_FIELDS,
     ).execute()
 
     replies = []
+    append = replies.append
     for item in response.get("items", []):
         snippet = item["snippet"]
-        replies.append({
+        append({
             "reply_id": item["id"],
             "parent_id": comment_id,
             "author": snippet["authorDisplayName"],
-            "author_channel_id": snippet.get("authorChannelId", {}).get("value", ""),
+            "author_channel_id": author_channel_id(snippet),
             "text": snippet["textDisplay"],
             "like_count": snippet.get("likeCount", 0),
             "published_at": snippet["publishedAt"],
@@ -144,8 +191,7 @@ def post_comment(
         Dict with comment details
     """
     text = text[:10000]
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     response = youtube.commentThreads().insert(
         part="snippet",
@@ -187,18 +233,9 @@ def moderate_comment(
     Returns:
         Dict confirming the action
     """
-    valid_statuses = {"published", "heldForReview", "rejected"}
-    if moderation_status not in valid_statuses:
-        raise ValueError(f"Invalid moderation status: {moderation_status}. Must be one of: {valid_statuses}")
-
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
-
-    youtube.comments().setModerationStatus(
-        id=comment_id,
-        moderationStatus=moderation_status,
-        banAuthor=ban_author,
-    ).execute()
+    errors = _set_moderation_status([comment_id], moderation_status, ban_author)
+    if errors:
+        raise errors[comment_id]
 
     return {
         "comment_id": comment_id,
@@ -208,6 +245,79 @@ def moderate_comment(
     }
 
 
+def moderate_comments(
+    comment_ids: list[str],
+    moderation_status: str = "published",
+    ban_author: bool = False,
+) -> dict:
+    """Set the moderation status of several comments at once.
+
+    Args:
+        comment_ids: The comment IDs to moderate
+        moderation_status: One of 'published', 'heldForReview', 'rejected'
+        ban_author: If True, also ban the comment authors (only with 'rejected')
+
+    Returns:
+        Dict with moderation_status, ban_author, the moderated comment_ids,
+        and failed (error message by comment ID) for comments that could not
+        be moderated. IDs share a setModerationStatus call 50 at a time, so
+        one invalid ID fails the others sent with it.
+    """
+    comment_ids = list(dict.fromkeys(comment_ids))
+    errors = _set_moderation_status(comment_ids, moderation_status, ban_author)
+    return {
+        "comment_ids": [cid for cid in comment_ids if cid not in errors],
+        "moderation_status": moderation_status,
+        "ban_author": ban_author,
+        "failed": {cid: f"{type(e).__name__}: {e}" for cid, e in errors.items()},
+    }
+
+
+def _set_moderation_status(
+    comment_ids: list[str],
+    moderation_status: str,
+    ban_author: bool,
+) -> dict[str, Exception]:
+    """Moderate comments, 50 IDs per setModerationStatus call.
+
+    The calls are sent together as an HTTP batch request when there are
+    several.
+
+    Returns:
+        The exception each failed comment's call raised, by comment ID
+
+    Raises:
+        ValueError: If moderation_status is not valid
+    """
+    if moderation_status not in _MODERATION_STATUSES:
+        raise ValueError(
+            f"Invalid moderation status: {moderation_status}. "
+            f"Must be one of: {', '.join(sorted(_MODERATION_STATUSES))}"
+        )
+    if not comment_ids:
+        return {}
+
+    youtube = get_youtube_service()
+    chunks = [
+        comment_ids[start:start + _MODERATION_IDS_PER_REQUEST]
+        for start in range(0, len(comment_ids), _MODERATION_IDS_PER_REQUEST)
+    ]
+    results = execute_requests(youtube, {
+        str(index): youtube.comments().setModerationStatus(
+            id=",".join(chunk),
+            moderationStatus=moderation_status,
+            banAuthor=ban_author,
+        )
+        for index, chunk in enumerate(chunks)
+    })
+    errors = {}
+    for index, chunk in enumerate(chunks):
+        result = results[str(index)]
+        if isinstance(result, Exception):
+            errors.update(dict.fromkeys(chunk, result))
+    return errors
+
+
 def list_held_comments(
     video_id: Optional[str] = None,
     max_results: int = 20,
@@ -222,44 +332,39 @@ def list_held_comments(
         List of comment dicts held for review
     """
     max_results = max(1, min(100, max_results))
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     kwargs = {
         "part": "snippet",
         "moderationStatus": "heldForReview",
         "maxResults": max_results,
         "textFormat": "plainText",
+        "fields": _HELD_COMMENT_THREAD_FIELDS,
     }
 
     if video_id:
         kwargs["videoId"] = video_id
     else:
-        kwargs["allThreadsRelatedToChannelId"] = _get_channel_id(youtube)
+        kwargs["allThreadsRelatedToChannelId"] = get_channel_id()
 
     response = youtube.commentThreads().list(**kwargs).execute()
 
     comments = []
+    append = comments.append
     for item in response.get("items", []):
-        snippet = item["snippet"]["topLevelComment"]["snippet"]
-        comments.append({
-            "comment_id": item["snippet"]["topLevelComment"]["id"],
+        thread = item["snippet"]
+        comment = thread["topLevelComment"]
+        snippet = comment["snippet"]
+        append({
+            "comment_id": comment["id"],
             "thread_id": item["id"],
-            "video_id": item["snippet"].get("videoId", ""),
+            "video_id": thread.get("videoId", ""),
             "author": snippet["authorDisplayName"],
-            "author_channel_id": snippet.get("authorChannelId", {}).get("value", ""),
+            "author_channel_id": author_channel_id(snippet),
             "text": snippet["textDisplay"],
             "like_count": snippet.get("likeCount", 0),
             "published_at": snippet["publishedAt"],
-            "reply_count": item["snippet"]["totalReplyCount"],
+            "reply_count": thread["totalReplyCount"],
         })
 
     return comments
-
-
-def _get_channel_id(youtube) -> str:
-    """Get the authenticated user's channel ID."""
-    response = youtube.channels().list(part="id", mine=True).execute()
-    if not response.get("items"):
-        raise ValueError("No channel found for authenticated user")
-    return response["items"][0]["id"]
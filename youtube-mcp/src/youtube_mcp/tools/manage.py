@@ -1,12 +1,74 @@
 """Video management tools for YouTube MCP Server."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from ..auth import get_credentials
+from ..auth import get_auth
 from ..schemas import PrivacyStatus, VideoInfo, VideoOrder
+from ..video_index import forget_video, index_videos
+from ._client import get_youtube_service
+from ._common import thumbnail_url
+
+
+# The Data API accepts up to 50 comma-separated IDs per videos.list call
+_MAX_IDS_PER_REQUEST = 50
+
+# Worker threads fetching videos.list chunks concurrently in get_videos; each
+# worker uses its own thread's service (see _client)
+_chunk_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="yt-videos")
+
+
+# Enum members by value, for lookups that fall back to a default
+_VIDEO_ORDERS = {o.value: o for o in VideoOrder}
+
+# list_videos order -> sort key (descending counts are negated)
+_SORT_KEYS = {
+    VideoOrder.VIEW_COUNT: lambda v: -v.view_count,
+    VideoOrder.RATING: lambda v: -v.like_count,
+    VideoOrder.TITLE: lambda v: v.title.casefold(),
+}
+
+# Uploads playlist ID per authorization (see YouTubeAuth.cache_namespace)
+_uploads_playlist_ids: dict[str, str] = {}
+
+# Partial-response projection of the video resource fields _parse_video reads
+_VIDEO_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,thumbnails/high/url),"
+    "status/privacyStatus,statistics(viewCount,likeCount,commentCount),"
+    "contentDetails/duration)"
+)
+# list_videos also fetches what the local search index stores
+_INDEXED_VIDEO_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,thumbnails/high/url,"
+    "channelId,channelTitle,tags),"
+    "status/privacyStatus,statistics(viewCount,likeCount,commentCount),"
+    "contentDetails/duration)"
+)
+
+
+def _parse_video(item: dict) -> VideoInfo:
+    """Parse a videos.list response item into VideoInfo."""
+    snippet = item["snippet"]
+    status = item["status"]
+    stats = item.get("statistics", {})
+    content = item.get("contentDetails", {})
+
+    # The values below are already of the declared types, so skip pydantic's
+    # per-field validation (the dominant cost when parsing 50-item pages)
+    return VideoInfo.model_construct(
+        video_id=item["id"],
+        title=snippet["title"],
+        description=snippet.get("description", ""),
+        published_at=snippet["publishedAt"],
+        privacy=status["privacyStatus"],
+        view_count=int(stats.get("viewCount", 0)),
+        like_count=int(stats.get("likeCount", 0)),
+        comment_count=int(stats.get("commentCount", 0)),
+        duration=content.get("duration", "PT0S"),
+        thumbnail_url=thumbnail_url(snippet),
+    )
 
 
 def get_video(video_id: str) -> VideoInfo:
@@ -21,35 +83,81 @@ def get_video(video_id: str) -> VideoInfo:
     Raises:
         HttpError: If video not found or API error
     """
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     response = youtube.videos().list(
         part="snippet,status,statistics,contentDetails",
         id=video_id,
+        fields=_VIDEO_FIELDS,
     ).execute()
 
     if not response.get("items"):
         raise ValueError(f"Video not found: {video_id}")
 
-    item = response["items"][0]
-    snippet = item["snippet"]
-    status = item["status"]
-    stats = item.get("statistics", {})
-    content = item.get("contentDetails", {})
+    return _parse_video(response["items"][0])
 
-    return VideoInfo(
-        video_id=item["id"],
-        title=snippet["title"],
-        description=snippet.get("description", ""),
-        published_at=snippet["publishedAt"],
-        privacy=status["privacyStatus"],
-        view_count=int(stats.get("viewCount", 0)),
-        like_count=int(stats.get("likeCount", 0)),
-        comment_count=int(stats.get("commentCount", 0)),
-        duration=content.get("duration", "PT0S"),
-        thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
-    )
+
+def _fetch_videos_chunk(video_ids: list[str]) -> dict:
+    """Fetch up to _MAX_IDS_PER_REQUEST videos with one videos.list call."""
+    return get_youtube_service().videos().list(
+        part="snippet,status,statistics,contentDetails",
+        id=",".join(video_ids),
+        maxResults=len(video_ids),
+        fields=_VIDEO_FIELDS,
+    ).execute()
+
+
+def get_videos(video_ids: list[str]) -> list[VideoInfo]:
+    """Get detailed information about several videos in as few API calls as possible.
+
+    Args:
+        video_ids: YouTube video IDs (fetched 50 per request)
+
+    Returns:
+        List of VideoInfo objects in the requested order; IDs that were not
+        found are omitted
+    """
+    if not video_ids:
+        return []
+
+    chunks = [
+        video_ids[start:start + _MAX_IDS_PER_REQUEST]
+        for start in range(0, len(video_ids), _MAX_IDS_PER_REQUEST)
+    ]
+    if len(chunks) == 1:
+        responses = [_fetch_videos_chunk(chunks[0])]
+    else:
+        responses = list(_chunk_executor.map(_fetch_videos_chunk, chunks))
+
+    videos_by_id = {}
+    for response in responses:
+        for item in response.get("items", []):
+            videos_by_id[item["id"]] = _parse_video(item)
+
+    return [videos_by_id[vid] for vid in dict.fromkeys(video_ids) if vid in videos_by_id]
+
+
+def _get_uploads_playlist_id(youtube) -> Optional[str]:
+    """Get the ID of the authenticated channel's uploads playlist.
+
+    Looked up once per authorization, as it never changes.
+
+    Returns:
+        Playlist ID, or None if the account has no channel
+    """
+    account = get_auth().cache_namespace()
+    playlist_id = _uploads_playlist_ids.get(account)
+    if playlist_id is None:
+        response = youtube.channels().list(
+            part="contentDetails",
+            mine=True,
+            fields="items/contentDetails/relatedPlaylists/uploads",
+        ).execute()
+        if not response.get("items"):
+            return None
+        playlist_id = response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+        _uploads_playlist_ids[account] = playlist_id
+    return playlist_id
 
 
 def list_videos(
@@ -67,33 +175,29 @@ def list_videos(
     """
     max_results = max(1, min(50, max_results))
 
-    try:
-        video_order = VideoOrder(order)
-    except ValueError:
-        video_order = VideoOrder.DATE
+    video_order = _VIDEO_ORDERS.get(order, VideoOrder.DATE)
 
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     # First, get the channel's upload playlist
-    channels_response = youtube.channels().list(
-        part="contentDetails",
-        mine=True,
-    ).execute()
-
-    if not channels_response.get("items"):
+    uploads_playlist_id = _get_uploads_playlist_id(youtube)
+    if uploads_playlist_id is None:
         return []
 
-    uploads_playlist_id = channels_response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
-
     # Get videos from uploads playlist
     playlist_response = youtube.playlistItems().list(
         part="snippet",
         playlistId=uploads_playlist_id,
         maxResults=max_results,
+        fields="nextPageToken,items/snippet/resourceId/videoId",
     ).execute()
 
+    # Without a next page, this listing reached the channel's first upload
+    complete = "nextPageToken" not in playlist_response
+
     if not playlist_response.get("items"):
+        if complete:
+            index_videos([], complete_since="")
         return []
 
     # Get video IDs
@@ -103,36 +207,24 @@ def list_videos(
     videos_response = youtube.videos().list(
         part="snippet,status,statistics,contentDetails",
         id=",".join(video_ids),
+        fields=_INDEXED_VIDEO_FIELDS,
     ).execute()
 
-    videos = []
-    for item in videos_response.get("items", []):
-        snippet = item["snippet"]
-        status = item["status"]
-        stats = item.get("statistics", {})
-        content = item.get("contentDetails", {})
-
-        videos.append(VideoInfo(
-            video_id=item["id"],
-            title=snippet["title"],
-            description=snippet.get("description", ""),
-            published_at=snippet["publishedAt"],
-            privacy=status["privacyStatus"],
-            view_count=int(stats.get("viewCount", 0)),
-            like_count=int(stats.get("likeCount", 0)),
-            comment_count=int(stats.get("commentCount", 0)),
-            duration=content.get("duration", "PT0S"),
-            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
-        ))
-
-    # Sort based on order
-    if video_order == VideoOrder.VIEW_COUNT:
-        videos.sort(key=lambda v: v.view_count, reverse=True)
-    elif video_order == VideoOrder.RATING:
-        videos.sort(key=lambda v: v.like_count, reverse=True)
-    elif video_order == VideoOrder.TITLE:
-        videos.sort(key=lambda v: v.title.lower())
-    # DATE is default (already sorted by YouTube)
+    # These are the user's own uploads; keep them searchable locally. The
+    # playlist lists the newest uploads first, so the index now holds every
+    # video published since the oldest of them (see video_index).
+    items = videos_response.get("items", [])
+    videos = [_parse_video(item) for item in items]
+    if complete:
+        complete_since = ""
+    else:
+        complete_since = min((video.published_at for video in videos), default=None)
+    index_videos(items, complete_since)
+
+    # DATE is the playlist's own order (newest first), so needs no sorting
+    sort_key = _SORT_KEYS.get(video_order)
+    if sort_key is not None:
+        videos.sort(key=sort_key)
 
     return videos
 
@@ -161,12 +253,12 @@ def update_video(
     Raises:
         HttpError: If update fails
     """
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
-    # First, get current video data
+    # First, get current video data (with the parts VideoInfo needs, so the
+    # result can be built without fetching the video again)
     current = youtube.videos().list(
-        part="snippet,status",
+        part="snippet,status,statistics,contentDetails",
         id=video_id,
     ).execute()
 
@@ -177,12 +269,13 @@ def update_video(
     snippet = item["snippet"]
     status = item["status"]
 
-    # Prepare update body
+    # Prepare update body, truncating new values to YouTube limits (the
+    # current ones are already within them)
     body = {
         "id": video_id,
         "snippet": {
-            "title": title if title is not None else snippet["title"],
-            "description": description if description is not None else snippet.get("description", ""),
+            "title": title[:100] if title is not None else snippet["title"],
+            "description": description[:5000] if description is not None else snippet.get("description", ""),
             "tags": tags if tags is not None else snippet.get("tags", []),
             "categoryId": category_id if category_id is not None else snippet["categoryId"],
         },
@@ -191,18 +284,18 @@ def update_video(
         },
     }
 
-    # Truncate to YouTube limits
-    body["snippet"]["title"] = body["snippet"]["title"][:100]
-    body["snippet"]["description"] = body["snippet"]["description"][:5000]
-
     # Execute update
     response = youtube.videos().update(
         part="snippet,status",
         body=body,
     ).execute()
 
-    # Get updated video info
-    return get_video(video_id)
+    # The response carries the updated snippet and status; statistics and
+    # contentDetails are unaffected by the update
+    item["snippet"] = response.get("snippet", snippet)
+    item["status"] = response.get("status", status)
+    index_videos([item])
+    return _parse_video(item)
 
 
 def set_video_localization(
@@ -225,8 +318,9 @@ def set_video_localization(
     Raises:
         HttpError: If update fails
     """
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    localized_title = localized_title[:100]
+    localized_description = localized_description[:5000]
+    youtube = get_youtube_service()
 
     # Get current video data including existing localizations
     current = youtube.videos().list(
@@ -243,8 +337,8 @@ def set_video_localization(
     # Preserve existing localizations, add/update the new one
     localizations = item.get("localizations", {})
     localizations[language] = {
-        "title": localized_title[:100],
-        "description": localized_description[:5000],
+        "title": localized_title,
+        "description": localized_description,
     }
 
     # Set default language if not already set
@@ -273,8 +367,8 @@ def set_video_localization(
     return {
         "video_id": video_id,
         "language": language,
-        "localized_title": localized_title[:100],
-        "localized_description": localized_description[:5000],
+        "localized_title": localized_title,
+        "localized_description": localized_description,
         "total_localizations": len(localizations),
         "all_languages": list(localizations.keys()),
     }
@@ -292,8 +386,8 @@ def delete_video(video_id: str) -> bool:
     Raises:
         HttpError: If deletion fails
     """
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
     youtube.videos().delete(id=video_id).execute()
+    forget_video(video_id)
     return True
@@ -1,16 +1,26 @@
 """Playlist management tools for YouTube MCP Server."""
 
-from typing import Optional
+from typing import Iterator, Optional
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
 from ..schemas import PlaylistInfo, PlaylistItemInfo, PrivacyStatus
+from ._client import execute_requests, get_youtube_service
+from ._common import MAX_PAGED_RESULTS, fetch_pages, thumbnail_url
+
+# Enum members by value, for lookups that fall back to a default
+_PRIVACY_STATUSES = {s.value: s for s in PrivacyStatus}
 
+# Largest maxResults accepted by playlistItems.list
+_PLAYLIST_ITEM_PAGE_SIZE = 50
 
-def _get_youtube_service():
-    """Get YouTube Data API service."""
-    return build("youtube", "v3", credentials=get_credentials())
+# Partial-response projections of the fields the list tools read
+_PLAYLIST_FIELDS = (
+    "items(id,snippet(title,description,publishedAt,thumbnails/high/url),"
+    "status/privacyStatus,contentDetails/itemCount)"
+)
+_PLAYLIST_ITEM_FIELDS = (
+    "nextPageToken,items(id,snippet(resourceId/videoId,title,description,position,publishedAt,"
+    "thumbnails/high/url))"
+)
 
 
 def _parse_playlist(item: dict) -> PlaylistInfo:
@@ -18,14 +28,15 @@ def _parse_playlist(item: dict) -> PlaylistInfo:
     snippet = item["snippet"]
     status = item.get("status", {})
     content = item.get("contentDetails", {})
-    return PlaylistInfo(
+    # Already-typed values; construct without validation
+    return PlaylistInfo.model_construct(
         playlist_id=item["id"],
         title=snippet["title"],
         description=snippet.get("description", ""),
         privacy=status.get("privacyStatus", "private"),
         published_at=snippet.get("publishedAt", ""),
         item_count=int(content.get("itemCount", 0)),
-        thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+        thumbnail_url=thumbnail_url(snippet),
     )
 
 
@@ -39,12 +50,13 @@ def list_playlists(max_results: int = 25) -> list[PlaylistInfo]:
         List of PlaylistInfo objects
     """
     max_results = max(1, min(50, max_results))
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     response = youtube.playlists().list(
         part="snippet,status,contentDetails",
         mine=True,
         maxResults=max_results,
+        fields=_PLAYLIST_FIELDS,
     ).execute()
 
     return [_parse_playlist(item) for item in response.get("items", [])]
@@ -68,12 +80,9 @@ def create_playlist(
     title = title[:150]
     description = description[:5000]
 
-    try:
-        privacy_status = PrivacyStatus(privacy.lower())
-    except ValueError:
-        privacy_status = PrivacyStatus.PRIVATE
+    privacy_status = _PRIVACY_STATUSES.get(privacy.lower(), PrivacyStatus.PRIVATE)
 
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     response = youtube.playlists().insert(
         part="snippet,status,contentDetails",
@@ -108,7 +117,7 @@ def update_playlist(
     Returns:
         Updated PlaylistInfo
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     # Fetch current data
     current = youtube.playlists().list(
@@ -126,8 +135,8 @@ def update_playlist(
     body = {
         "id": playlist_id,
         "snippet": {
-            "title": (title if title is not None else snippet["title"])[:150],
-            "description": (description if description is not None else snippet.get("description", ""))[:5000],
+            "title": title[:150] if title is not None else snippet["title"],
+            "description": description[:5000] if description is not None else snippet.get("description", ""),
         },
         "status": {
             "privacyStatus": privacy if privacy is not None else status["privacyStatus"],
@@ -151,11 +160,52 @@ def delete_playlist(playlist_id: str) -> bool:
     Returns:
         True if deletion was successful
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
     youtube.playlists().delete(id=playlist_id).execute()
     return True
 
 
+def iter_playlist_items(
+    playlist_id: str,
+    max_results: int = MAX_PAGED_RESULTS,
+) -> Iterator[PlaylistItemInfo]:
+    """Yield the items of a playlist, fetching pages as they are consumed.
+
+    Stopping early saves the remaining pages, apart from the one already
+    being fetched in the background (see fetch_pages).
+
+    Args:
+        playlist_id: YouTube playlist ID
+        max_results: Maximum number of items to yield (1-500)
+
+    Yields:
+        PlaylistItemInfo objects in playlist order
+    """
+    max_results = max(1, min(MAX_PAGED_RESULTS, max_results))
+
+    def fetch_page(page_token: Optional[str], page_size: int) -> dict:
+        return get_youtube_service().playlistItems().list(
+            part="snippet",
+            playlistId=playlist_id,
+            maxResults=page_size,
+            pageToken=page_token,
+            fields=_PLAYLIST_ITEM_FIELDS,
+        ).execute()
+
+    for response in fetch_pages(fetch_page, max_results, _PLAYLIST_ITEM_PAGE_SIZE):
+        for item in response.get("items", []):
+            snippet = item["snippet"]
+            yield PlaylistItemInfo.model_construct(
+                playlist_item_id=item["id"],
+                video_id=snippet["resourceId"]["videoId"],
+                title=snippet["title"],
+                description=snippet.get("description", ""),
+                position=snippet["position"],
+                added_at=snippet.get("publishedAt", ""),
+                thumbnail_url=thumbnail_url(snippet),
+            )
+
+
 def list_playlist_items(
     playlist_id: str,
     max_results: int = 25,
@@ -164,34 +214,13 @@ def list_playlist_items(
 
     Args:
         playlist_id: YouTube playlist ID
-        max_results: Maximum number of items to return (1-50)
+        max_results: Maximum number of items to return (1-500); more than 50
+            are fetched over several pages
 
     Returns:
         List of PlaylistItemInfo objects
     """
-    max_results = max(1, min(50, max_results))
-    youtube = _get_youtube_service()
-
-    response = youtube.playlistItems().list(
-        part="snippet,contentDetails",
-        playlistId=playlist_id,
-        maxResults=max_results,
-    ).execute()
-
-    items = []
-    for item in response.get("items", []):
-        snippet = item["snippet"]
-        items.append(PlaylistItemInfo(
-            playlist_item_id=item["id"],
-            video_id=snippet["resourceId"]["videoId"],
-            title=snippet["title"],
-            description=snippet.get("description", ""),
-            position=snippet["position"],
-            added_at=snippet.get("publishedAt", ""),
-            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
-        ))
-
-    return items
+    return list(iter_playlist_items(playlist_id, max_results))
 
 
 def add_to_playlist(
@@ -209,7 +238,7 @@ def add_to_playlist(
     Returns:
         PlaylistItemInfo for the added item
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
 
     body = {
         "snippet": {
@@ -237,7 +266,7 @@ def add_to_playlist(
         description=snippet.get("description", ""),
         position=snippet["position"],
         added_at=snippet.get("publishedAt", ""),
-        thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+        thumbnail_url=thumbnail_url(snippet),
     )
 
 
@@ -250,6 +279,38 @@ def remove_from_playlist(playlist_item_id: str) -> bool:
     Returns:
         True if removal was successful
     """
-    youtube = _get_youtube_service()
+    youtube = get_youtube_service()
     youtube.playlistItems().delete(id=playlist_item_id).execute()
     return True
+
+
+def remove_from_playlist_bulk(playlist_item_ids: list[str]) -> dict:
+    """Remove several items from playlists with batched requests.
+
+    playlistItems.delete takes one ID per call, so the calls are sent as HTTP
+    batch requests of up to 50.
+
+    Args:
+        playlist_item_ids: Playlist item IDs (from list_playlist_items)
+
+    Returns:
+        Dict with removed (the IDs removed) and failed (error message by
+        playlist item ID)
+    """
+    playlist_item_ids = list(dict.fromkeys(playlist_item_ids))
+    if not playlist_item_ids:
+        return {"removed": [], "failed": {}}
+
+    youtube = get_youtube_service()
+    results = execute_requests(youtube, {
+        item_id: youtube.playlistItems().delete(id=item_id) for item_id in playlist_item_ids
+    })
+    failed = {
+        item_id: f"{type(result).__name__}: {result}"
+        for item_id, result in results.items()
+        if isinstance(result, Exception)
+    }
+    return {
+        "removed": [item_id for item_id in playlist_item_ids if item_id not in failed],
+        "failed": failed,
+    }
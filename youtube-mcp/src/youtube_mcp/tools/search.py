@@ -2,15 +2,19 @@
 
 from typing import Optional
 
-from googleapiclient.discovery import build
-
-from ..auth import get_credentials
 from ..schemas import SearchResult, SearchResultType, SearchOrder
+from ..video_index import search_own_videos
+from ._client import get_youtube_service
+from ._common import thumbnail_url
 
+# Enum members by value, for lookups that fall back to a default
+_RESULT_TYPES = {t.value: t for t in SearchResultType}
+_SEARCH_ORDERS = {o.value: o for o in SearchOrder}
 
-def _get_youtube_service():
-    """Get YouTube Data API service."""
-    return build("youtube", "v3", credentials=get_credentials())
+# Partial-response projection of the search result fields search reads
+_SEARCH_FIELDS = (
+    "items(id,snippet(title,description,channelTitle,channelId,publishedAt,thumbnails/high/url))"
+)
 
 
 def search(
@@ -24,14 +28,18 @@ def search(
 ) -> list[SearchResult]:
     """Search YouTube for videos, channels, or playlists.
 
-    Note: Each search call costs 100 quota units.
+    Note: Each search call costs 100 quota units. Video searches of the
+    user's own channel (channel_id="mine") are answered from the local index
+    of previously listed videos, at no quota cost, when it is known to hold
+    the complete result.
 
     Args:
         query: Search query string
         result_type: Type of results — video, channel, or playlist
         max_results: Maximum number of results (1-50)
         order: Sort order — relevance, date, viewCount, rating
-        channel_id: Restrict to a specific channel (optional)
+        channel_id: Restrict to a specific channel, or "mine" for the
+            authenticated user's channel (optional)
         published_after: Filter by publish date (RFC 3339, e.g. '2024-01-01T00:00:00Z')
         published_before: Filter by publish date (RFC 3339)
 
@@ -40,17 +48,31 @@ def search(
     """
     max_results = max(1, min(50, max_results))
 
-    try:
-        search_type = SearchResultType(result_type.lower())
-    except ValueError:
-        search_type = SearchResultType.VIDEO
-
-    try:
-        search_order = SearchOrder(order)
-    except ValueError:
-        search_order = SearchOrder.RELEVANCE
-
-    youtube = _get_youtube_service()
+    search_type = _RESULT_TYPES.get(result_type.lower(), SearchResultType.VIDEO)
+    search_order = _SEARCH_ORDERS.get(order, SearchOrder.RELEVANCE)
+
+    if channel_id == "mine":
+        if search_type != SearchResultType.VIDEO:
+            raise ValueError('channel_id "mine" only supports video searches')
+        hits = search_own_videos(
+            query, max_results, search_order.value, published_after, published_before
+        )
+        if hits is not None:
+            return [
+                SearchResult.model_construct(
+                    result_type="video",
+                    resource_id=hit["video_id"],
+                    title=hit["title"],
+                    description=hit["description"],
+                    channel_title=hit["channel_title"],
+                    channel_id=hit["channel_id"],
+                    published_at=hit["published_at"],
+                    thumbnail_url=hit["thumbnail_url"],
+                )
+                for hit in hits
+            ]
+
+    youtube = get_youtube_service()
 
     kwargs = {
         "part": "snippet",
@@ -58,9 +80,12 @@ def search(
         "type": search_type.value,
         "maxResults": max_results,
         "order": search_order.value,
+        "fields": _SEARCH_FIELDS,
     }
 
-    if channel_id:
+    if channel_id == "mine":
+        kwargs["forMine"] = True
+    elif channel_id:
         kwargs["channelId"] = channel_id
     if published_after:
         kwargs["publishedAfter"] = published_after
@@ -70,6 +95,7 @@ def search(
     response = youtube.search().list(**kwargs).execute()
 
     results = []
+    append = results.append
     for item in response.get("items", []):
         snippet = item["snippet"]
         item_id = item["id"]
@@ -88,7 +114,7 @@ def search(
             resource_id = ""
             rtype = item_id.get("kind", "unknown")
 
-        results.append(SearchResult(
+        append(SearchResult.model_construct(
             result_type=rtype,
             resource_id=resource_id,
             title=snippet.get("title", ""),
@@ -96,7 +122,7 @@ def search(
             channel_title=snippet.get("channelTitle", ""),
             channel_id=snippet.get("channelId", ""),
             published_at=snippet.get("publishedAt", ""),
-            thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url", ""),
+            thumbnail_url=thumbnail_url(snippet),
         ))
 
     return results
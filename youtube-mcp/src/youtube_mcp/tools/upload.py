@@ -1,15 +1,136 @@
 """Video upload tools for YouTube MCP Server."""
 
+import hashlib
+import io
+import logging
+import mimetypes
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaIoBaseUpload
 from googleapiclient.errors import HttpError
 
-from ..auth import get_credentials
+from ..auth import get_auth
+from ..cache import MISSING, TTLCache
 from ..schemas import PrivacyStatus, UploadVideoResult
+from ..video_index import index_videos
+from ._client import get_youtube_service
+
+# Pillow (optional, see the "speedups" extra) re-encodes large PNG thumbnails
+# as much smaller JPEGs; without it they are uploaded as they are.
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+_MIB = 1024 * 1024
+# Largest resumable upload chunk size accepted, in MiB. Every chunk is a
+# separate HTTPS request, so larger chunks cut per-request overhead; a failed
+# chunk is retried on its own without restarting the upload, so smaller ones
+# resend less. Whole MiB are always a multiple of the required 256 KiB.
+_MAX_CHUNK_SIZE_MIB = 256
+# Without an explicit chunk size, chunks start at 4 MiB and are resized
+# between 1 and 64 MiB to take about _CHUNK_TARGET_SECONDS each: doubled
+# after a chunk that went through in under half that, halved after one that
+# took over twice as long (slow or lossy link, retries)
+_INITIAL_CHUNK_SIZE_MIB = 4
+_MAX_ADAPTIVE_CHUNK_SIZE_MIB = 64
+_CHUNK_TARGET_SECONDS = 10.0
+# Files up to this size are sent in one multipart request instead, skipping
+# the extra round-trip that opens a resumable session. That request is not
+# retried, as it is not idempotent.
+_SIMPLE_UPLOAD_MAX_SIZE = 5 * _MIB
+# Retries per chunk on transient errors, with googleapiclient's own
+# exponential backoff
+_CHUNK_RETRIES = 5
+# Read buffer of the video file. http.client sends a chunk by reading the
+# file 8 KiB at a time, which with the default buffer is one read() syscall
+# each; a larger buffer serves those from far fewer, larger reads
+_READ_BUFFER_SIZE = _MIB
+
+_WATCH_URL_PREFIX = "https://www.youtube.com/watch?v="
+
+# The status part of an upload request body per privacy status; only read
+# when the body is serialized, so shared between calls
+_UPLOAD_STATUSES = {
+    privacy: {"privacyStatus": privacy.value, "selfDeclaredMadeForKids": False}
+    for privacy in PrivacyStatus
+}
+
+# Accepted thumbnail extensions and their MIME types, and the size limit
+_THUMBNAIL_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+}
+_THUMBNAIL_MAX_SIZE = 2 * _MIB
+# SHA-256 of the image last set as each video's thumbnail, keyed by (account,
+# video ID), so setting the same image again skips the upload. Entries expire
+# since the thumbnail can also be changed outside this server.
+_thumbnail_digests = TTLCache(maxsize=1024, ttl=3600.0)
+# PNG thumbnails larger than this are sent as JPEG (at this quality) when
+# that is smaller; YouTube serves thumbnails as JPEG regardless. The JPEG,
+# or None if there is no smaller one, is kept per source SHA-256 so the same
+# image set on several videos is encoded once.
+_REENCODE_MIN_SIZE = 512 * 1024
+_JPEG_QUALITY = 90
+_jpeg_thumbnails = TTLCache(maxsize=16, ttl=3600.0)
+
+# A just-uploaded video can briefly be unknown to the thumbnails endpoint, so
+# a 404 there is retried a few times (after 1 s, then 2 s)
+_THUMBNAIL_ATTEMPTS = 3
+
+# Deletes uploaded source files in the background: freeing the blocks of a
+# multi-GB file can take a while on some filesystems, and the caller need not
+# wait for it. Pending deletions finish before the interpreter exits.
+_cleanup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yt-cleanup")
+
+
+def _advise(fd: int, offset: int, length: int, advice: int) -> None:
+    """Pass an access pattern hint to the kernel (best effort, POSIX only)."""
+    try:
+        os.posix_fadvise(fd, offset, length, advice)
+    except OSError:
+        pass
+
+
+class _ResizableUpload(MediaIoBaseUpload):
+    """MediaIoBaseUpload whose chunk size can change between chunks.
+
+    HttpRequest.next_chunk asks chunksize() for the size of every chunk, so
+    setting chunk_size takes effect from the next one, within the same
+    resumable session.
+    """
+
+    def __init__(self, fd, mimetype: str, chunk_size: int, resumable: bool):
+        super().__init__(fd, mimetype, chunksize=chunk_size, resumable=resumable)
+        self.chunk_size = chunk_size
+
+    def chunksize(self) -> int:
+        return self.chunk_size
+
+
+def _next_chunk_size(chunk_size: int, elapsed: float) -> int:
+    """Return the size of the next adaptive chunk, given how long the last took."""
+    if elapsed < _CHUNK_TARGET_SECONDS / 2 and chunk_size < _MAX_ADAPTIVE_CHUNK_SIZE_MIB * _MIB:
+        return chunk_size * 2
+    if elapsed > _CHUNK_TARGET_SECONDS * 2 and chunk_size > _MIB:
+        return chunk_size // 2
+    return chunk_size
+
+
+def _remove_file(path: Path) -> None:
+    """Delete a file, ignoring errors (best-effort cleanup)."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
 
 
 def upload_video(
@@ -20,6 +141,7 @@ def upload_video(
     privacy: str = "private",
     category_id: str = "22",
     thumbnail_path: Optional[str] = None,
+    chunk_size_mib: Optional[int] = None,
 ) -> UploadVideoResult:
     """Upload a video to YouTube.
 
@@ -31,6 +153,9 @@ def upload_video(
         privacy: Privacy status (public, private, unlisted)
         category_id: YouTube category ID (default: 22 = People & Blogs)
         thumbnail_path: Optional path to thumbnail image
+        chunk_size_mib: Resumable upload chunk size in MiB (1-256); larger
+            chunks mean fewer requests, smaller ones less to resend on failure.
+            If omitted, the size adapts to the measured upload speed.
 
     Returns:
         UploadVideoResult with video_id and URL
@@ -39,10 +164,7 @@ def upload_video(
         FileNotFoundError: If video file doesn't exist
         HttpError: If upload fails
     """
-    # Validate file exists
-    video_path = Path(file_path).expanduser().resolve()
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video file not found: {file_path}")
+    video_path = Path(file_path).expanduser()
 
     # Validate privacy status
     try:
@@ -50,79 +172,152 @@ def upload_video(
     except ValueError:
         raise ValueError(f"Invalid privacy status: {privacy}. Must be one of: public, private, unlisted")
 
-    # Truncate title and description to YouTube limits
+    # Truncate title and description to YouTube limits (slicing returns the
+    # string itself when it is already short enough)
     title = title[:100]
     description = description[:5000]
-    tags = tags or []
-
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
 
     # Prepare video metadata
     body = {
         "snippet": {
             "title": title,
             "description": description,
-            "tags": tags,
+            "tags": tags or (),
             "categoryId": category_id,
         },
-        "status": {
-            "privacyStatus": privacy_status.value,
-            "selfDeclaredMadeForKids": False,
-        },
+        "status": _UPLOAD_STATUSES[privacy_status],
     }
 
-    # Create media upload (resumable for large files)
-    media = MediaFileUpload(
-        str(video_path),
-        chunksize=1024 * 1024,  # 1MB chunks
-        resumable=True,
-    )
+    mimetype = mimetypes.guess_type(video_path.name)[0] or "application/octet-stream"
+    adaptive = chunk_size_mib is None
+    if adaptive:
+        chunk_size = _INITIAL_CHUNK_SIZE_MIB * _MIB
+    else:
+        chunk_size = max(1, min(_MAX_CHUNK_SIZE_MIB, chunk_size_mib)) * _MIB
 
-    # Execute upload
-    request = youtube.videos().insert(
-        part="snippet,status",
-        body=body,
-        media_body=media,
-    )
+    # Opening the file is the existence check: one open() and fstat() rather
+    # than resolve() and exists() walking the path, and the file cannot
+    # vanish between the check and the upload
+    try:
+        fh = open(video_path, "rb", buffering=_READ_BUFFER_SIZE)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Video file not found: {file_path}") from None
+
+    with fh:
+        youtube = get_youtube_service()
+
+        # Create media upload (resumable for large files)
+        resumable = os.fstat(fh.fileno()).st_size > _SIMPLE_UPLOAD_MAX_SIZE
+        media = _ResizableUpload(fh, mimetype, chunk_size, resumable)
 
-    response = None
-    while response is None:
-        status, response = request.next_chunk()
-        if status:
-            # Progress reporting could be added here
-            pass
+        # Execute upload
+        request = youtube.videos().insert(
+            part="snippet,status",
+            body=body,
+            media_body=media,
+        )
+
+        if resumable:
+            # The file is read front to back once: let the kernel read ahead
+            # aggressively, and before each chunk goes out ask it to start
+            # reading the one after, so disk reads overlap the network send.
+            # Data the server has confirmed is never read again (the file is
+            # deleted afterwards), so its pages are dropped from the page
+            # cache rather than pushing out other processes' data.
+            advise = hasattr(os, "posix_fadvise")
+            if advise:
+                _advise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            response = None
+            while response is None:
+                if advise:
+                    _advise(
+                        fh.fileno(), request.resumable_progress + chunk_size, chunk_size,
+                        os.POSIX_FADV_WILLNEED,
+                    )
+                started = time.monotonic()
+                status, response = request.next_chunk(num_retries=_CHUNK_RETRIES)
+                if adaptive and response is None:
+                    chunk_size = _next_chunk_size(chunk_size, time.monotonic() - started)
+                    media.chunk_size = chunk_size
+                # (a length of 0 would mean "to the end of the file")
+                if advise and response is None and request.resumable_progress:
+                    _advise(fh.fileno(), 0, request.resumable_progress, os.POSIX_FADV_DONTNEED)
+                if status:
+                    logger.info("Uploading %s: %.0f%%", video_path.name, status.progress() * 100)
+        else:
+            # Not retried: unlike a chunk of a resumable session, a repeated
+            # insert after a lost response would create a second video
+            # (see server._NON_IDEMPOTENT)
+            response = request.execute()
 
     video_id = response["id"]
+    # Keep the local index complete for searches of the channel's newest
+    # videos (see video_index)
+    index_videos([response])
+
+    # Clean up source video file after successful upload
+    _cleanup_executor.submit(_remove_file, video_path)
 
     # Set thumbnail if provided
     if thumbnail_path:
         try:
-            set_thumbnail(video_id, thumbnail_path)
+            _set_new_thumbnail(video_id, thumbnail_path)
         except Exception as e:
             # Log but don't fail the upload
-            pass
+            logger.warning("Could not set thumbnail of %s: %s", video_id, e)
 
-    # Clean up source video file after successful upload
-    try:
-        video_path.unlink()
-    except OSError:
-        pass  # Best-effort cleanup
-
-    return UploadVideoResult(
+    # The API stores title and privacy exactly as sent, so the result is
+    # built from the validated local values; construct without validation
+    return UploadVideoResult.model_construct(
         video_id=video_id,
-        url=f"https://www.youtube.com/watch?v={video_id}",
-        title=response["snippet"]["title"],
-        privacy=response["status"]["privacyStatus"],
+        url=_WATCH_URL_PREFIX + video_id,
+        title=title,
+        privacy=privacy_status.value,
     )
 
 
-def set_thumbnail(video_id: str, thumbnail_path: str) -> bool:
+def _png_as_jpeg(data: bytes, digest: bytes) -> Optional[bytes]:
+    """Re-encode a PNG as JPEG; None if it has transparency or would not shrink."""
+    jpeg = _jpeg_thumbnails.get(digest)
+    if jpeg is not MISSING:
+        return jpeg
+
+    jpeg = None
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # JPEG has no alpha channel
+            if "A" not in image.getbands() and "transparency" not in image.info:
+                buffer = io.BytesIO()
+                image.convert("RGB").save(
+                    buffer, "JPEG", quality=_JPEG_QUALITY, optimize=True, progressive=True,
+                )
+                if buffer.tell() < len(data):
+                    jpeg = buffer.getvalue()
+    except (OSError, Image.DecompressionBombError):
+        pass  # Not decodable here; upload the original and let the API judge it
+    _jpeg_thumbnails.set(digest, jpeg)
+    return jpeg
+
+
+def _set_new_thumbnail(video_id: str, thumbnail_path: str) -> bool:
+    """Set the thumbnail of a video that has just been uploaded."""
+    for attempt in range(_THUMBNAIL_ATTEMPTS):
+        try:
+            return set_thumbnail(video_id, thumbnail_path)
+        except HttpError as e:
+            if e.resp.status != 404 or attempt == _THUMBNAIL_ATTEMPTS - 1:
+                raise
+            time.sleep(2**attempt)
+
+
+def set_thumbnail(video_id: str, thumbnail_path: str, reencode: bool = True) -> bool:
     """Set a custom thumbnail for a video.
 
     Args:
         video_id: YouTube video ID
         thumbnail_path: Path to thumbnail image (must be JPG, PNG, or GIF, max 2MB)
+        reencode: Upload PNGs over 512 KiB as JPEG (quality 90) when that is
+            smaller; needs Pillow
 
     Returns:
         True if successful
@@ -131,27 +326,45 @@ def set_thumbnail(video_id: str, thumbnail_path: str) -> bool:
         FileNotFoundError: If thumbnail file doesn't exist
         HttpError: If thumbnail upload fails
     """
-    path = Path(thumbnail_path).expanduser().resolve()
-    if not path.exists():
-        raise FileNotFoundError(f"Thumbnail file not found: {thumbnail_path}")
+    path = Path(thumbnail_path).expanduser()
 
     # Validate file extension
-    valid_extensions = {".jpg", ".jpeg", ".png", ".gif"}
-    if path.suffix.lower() not in valid_extensions:
-        raise ValueError(f"Invalid thumbnail format. Must be one of: {valid_extensions}")
+    mimetype = _THUMBNAIL_MIME_TYPES.get(path.suffix.lower())
+    if mimetype is None:
+        raise ValueError(
+            f"Invalid thumbnail format. Must be one of: {', '.join(_THUMBNAIL_MIME_TYPES)}"
+        )
+
+    try:
+        fh = open(path, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Thumbnail file not found: {thumbnail_path}") from None
+
+    with fh:
+        # Check file size (max 2MB)
+        if os.fstat(fh.fileno()).st_size > _THUMBNAIL_MAX_SIZE:
+            raise ValueError("Thumbnail file must be less than 2MB")
+        data = fh.read()
+
+    key = (get_auth().cache_namespace(), video_id)
+    digest = hashlib.sha256(data).digest()
+    if _thumbnail_digests.get(key) == digest:
+        return True
 
-    # Check file size (max 2MB)
-    if path.stat().st_size > 2 * 1024 * 1024:
-        raise ValueError("Thumbnail file must be less than 2MB")
+    if reencode and Image is not None and mimetype == "image/png" and len(data) > _REENCODE_MIN_SIZE:
+        jpeg = _png_as_jpeg(data, digest)
+        if jpeg is not None:
+            data, mimetype = jpeg, "image/jpeg"
 
-    credentials = get_credentials()
-    youtube = build("youtube", "v3", credentials=credentials)
+    youtube = get_youtube_service()
 
-    media = MediaFileUpload(str(path), mimetype=f"image/{path.suffix[1:].lower()}")
+    # The MIME type must be the registered one (image/jpeg, not image/jpg)
+    media = MediaIoBaseUpload(io.BytesIO(data), mimetype)
 
     youtube.thumbnails().set(
         videoId=video_id,
         media_body=media,
     ).execute()
+    _thumbnail_digests.set(key, digest)
 
     return True
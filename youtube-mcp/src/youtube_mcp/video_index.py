@@ -0,0 +1,279 @@
+"""Local full-text index of the authenticated channel's videos.
+
+Videos fetched by the management tools are indexed in a sqlite FTS5 table so
+that searches of the user's own channel can be answered without spending 100
+quota units on search.list.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .auth import get_auth
+from .cache import CACHE_DIR
+from .tools._common import thumbnail_url
+
+logger = logging.getLogger(__name__)
+
+# Entries older than this are ignored, so deleted or edited videos drop out of
+# local search results after a day at most
+_MAX_AGE = 86_400
+
+# A search can only be answered locally when the index is known to hold every
+# video the result could include. That is known from the coverage table, which
+# records per account the publish time of the oldest video of the latest
+# listing of the channel's newest uploads ("" when the listing reached the
+# first upload); see _covers for when that suffices. Uploads made outside
+# this server after that listing are not in the index, so coverage is only
+# trusted for as long as the listing itself is cached (the youtube_list_videos
+# TTL in server._CACHE_TTL).
+_COVERAGE_MAX_AGE = 300
+
+# search.list order -> ORDER BY clause
+_ORDER_BY = {
+    "relevance": "bm25(videos)",
+    "date": "published_at DESC",
+    "viewCount": "view_count DESC",
+    "rating": "like_count DESC",
+}
+
+
+def _match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query matching all of its words."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+class VideoIndex:
+    """Full-text index of video metadata, partitioned by account."""
+
+    def __init__(self, path: Path):
+        """Open (creating if needed) the index database.
+
+        Args:
+            path: Path of the sqlite database file
+
+        Raises:
+            OSError: If the directory cannot be created
+            sqlite3.Error: If the database cannot be opened
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS videos USING fts5("
+            "title, description, tags, "
+            "video_id UNINDEXED, account UNINDEXED, channel_id UNINDEXED, "
+            "channel_title UNINDEXED, published_at UNINDEXED, thumbnail_url UNINDEXED, "
+            "view_count UNINDEXED, like_count UNINDEXED, indexed_at UNINDEXED)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS coverage ("
+            "account TEXT PRIMARY KEY, published_since TEXT, recorded_at REAL)"
+        )
+
+    def add(self, account: str, items: list[dict]) -> None:
+        """Index (or re-index) videos.list response items."""
+        now = time.time()
+        rows = []
+        for item in items:
+            snippet = item.get("snippet", {})
+            stats = item.get("statistics", {})
+            rows.append((
+                snippet.get("title", ""),
+                snippet.get("description", ""),
+                " ".join(snippet.get("tags", [])),
+                item["id"],
+                account,
+                snippet.get("channelId", ""),
+                snippet.get("channelTitle", ""),
+                snippet.get("publishedAt", ""),
+                thumbnail_url(snippet),
+                int(stats.get("viewCount", 0)),
+                int(stats.get("likeCount", 0)),
+                now,
+            ))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM videos WHERE account = ? AND video_id = ?",
+                    [(account, row[3]) for row in rows],
+                )
+                self._conn.executemany(
+                    "INSERT INTO videos VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def set_coverage(self, account: str, published_since: str) -> None:
+        """Record that every video published since published_since is indexed."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO coverage VALUES (?, ?, ?)",
+                (account, published_since, time.time()),
+            )
+
+    def coverage(self, account: str) -> Optional[str]:
+        """Return the publish time since which all videos are indexed, if known.
+
+        Returns:
+            RFC 3339 timestamp, "" if every video is indexed, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT published_since FROM coverage WHERE account = ? AND recorded_at > ?",
+                (account, time.time() - _COVERAGE_MAX_AGE),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def remove(self, account: str, video_id: str) -> None:
+        """Drop a video from the index."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM videos WHERE account = ? AND video_id = ?", (account, video_id)
+            )
+
+    def search(
+        self,
+        account: str,
+        query: str,
+        max_results: int,
+        order: str = "relevance",
+        published_after: Optional[str] = None,
+        published_before: Optional[str] = None,
+    ) -> list[dict]:
+        """Find indexed videos of an account matching every word of query.
+
+        Returns:
+            List of dicts with video_id, title, description, channel_id,
+            channel_title, published_at and thumbnail_url
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+        sql = (
+            "SELECT video_id, title, description, channel_id, channel_title, "
+            "published_at, thumbnail_url FROM videos "
+            "WHERE videos MATCH ? AND account = ? AND indexed_at > ?"
+        )
+        params: list = [expression, account, time.time() - _MAX_AGE]
+        # publishedAt values are RFC 3339 UTC timestamps, which sort as text
+        if published_after:
+            sql += " AND published_at >= ?"
+            params.append(published_after)
+        if published_before:
+            sql += " AND published_at < ?"
+            params.append(published_before)
+        sql += f" ORDER BY {_ORDER_BY.get(order, _ORDER_BY['relevance'])} LIMIT ?"
+        params.append(max_results)
+
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+_index: Optional[VideoIndex] = None
+_index_failed = False
+_index_lock = threading.Lock()
+
+
+def _get_index() -> Optional[VideoIndex]:
+    """Get the shared index, opening it on first use.
+
+    Returns:
+        The index, or None if it could not be opened
+    """
+    global _index, _index_failed
+    with _index_lock:
+        if _index is None and not _index_failed:
+            try:
+                _index = VideoIndex(CACHE_DIR / "videos.sqlite3")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Local video index disabled: %s", e)
+                _index_failed = True
+        return _index
+
+
+def index_videos(items: list[dict], complete_since: Optional[str] = None) -> None:
+    """Index videos.list items of the authenticated account (best effort).
+
+    Args:
+        items: videos.list (or videos.insert/update) response items
+        complete_since: Set when items are all of the account's videos
+            published since this RFC 3339 time ("" for all of its videos)
+    """
+    index = _get_index()
+    if index is None or (not items and complete_since is None):
+        return
+    account = get_auth().cache_namespace()
+    try:
+        index.add(account, items)
+        if complete_since is not None:
+            index.set_coverage(account, complete_since)
+    except sqlite3.Error as e:
+        logger.warning("Could not index videos: %s", e)
+
+
+def forget_video(video_id: str) -> None:
+    """Remove a video of the authenticated account from the index (best effort)."""
+    index = _get_index()
+    if index is None:
+        return
+    try:
+        index.remove(get_auth().cache_namespace(), video_id)
+    except sqlite3.Error as e:
+        logger.warning("Could not remove video %s from the index: %s", video_id, e)
+
+
+def _covers(since: Optional[str], order: str, published_after: Optional[str]) -> bool:
+    """Tell whether a search result from the index is known to be complete.
+
+    Args:
+        since: Coverage of the account (see VideoIndex.coverage)
+        order: search.list order of the search
+        published_after: Lower publish time bound of the search, if any
+    """
+    # With every video indexed, any order is answered from the full set
+    if since == "":
+        return True
+    # Otherwise only the newest videos are known, which is enough for a date
+    # ordered search that does not reach further back. Ranking by relevance
+    # or counts would only rank within those. RFC 3339 UTC timestamps
+    # compare as text.
+    return since is not None and order == "date" and bool(published_after) and published_after >= since
+
+
+def search_own_videos(
+    query: str,
+    max_results: int,
+    order: str = "relevance",
+    published_after: Optional[str] = None,
+    published_before: Optional[str] = None,
+) -> Optional[list[dict]]:
+    """Search the authenticated account's indexed videos.
+
+    Returns:
+        Matching videos (see VideoIndex.search), or None if the index cannot
+        give the complete result (see the coverage note at the top)
+    """
+    index = _get_index()
+    # A query without words matches everything in search.list but nothing here
+    if index is None or not query.split():
+        return None
+    account = get_auth().cache_namespace()
+    try:
+        if not _covers(index.coverage(account), order, published_after):
+            return None
+        return index.search(
+            account, query, max_results, order, published_after, published_before,
+        )
+    except sqlite3.Error as e:
+        logger.warning("Local video search failed: %s", e)
+        return None
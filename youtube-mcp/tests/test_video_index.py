@@ -0,0 +1,105 @@
+"""Tests for when own-channel searches are answered from the local index."""
+
+import time
+
+import pytest
+
+from youtube_mcp import video_index
+
+LISTED_SINCE = "2024-03-01T00:00:00Z"
+
+
+class _Auth:
+    def cache_namespace(self) -> str:
+        return "account"
+
+
+def _item(video_id: str, published_at: str) -> dict:
+    return {"id": video_id, "snippet": {"title": f"cat video {video_id}", "publishedAt": published_at}}
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    index = video_index.VideoIndex(tmp_path / "videos.sqlite3")
+    monkeypatch.setattr(video_index, "_index", index)
+    monkeypatch.setattr(video_index, "get_auth", _Auth)
+    return index
+
+
+@pytest.mark.parametrize(
+    ("since", "order", "published_after", "expected"),
+    [
+        # Whole channel indexed: complete in any order
+        ("", "relevance", None, True),
+        ("", "viewCount", None, True),
+        ("", "date", None, True),
+        # Only the newest videos indexed: date order within the covered range
+        (LISTED_SINCE, "date", "2024-04-01T00:00:00Z", True),
+        (LISTED_SINCE, "date", LISTED_SINCE, True),
+        (LISTED_SINCE, "date", "2024-01-01T00:00:00Z", False),
+        (LISTED_SINCE, "date", None, False),
+        (LISTED_SINCE, "relevance", "2024-04-01T00:00:00Z", False),
+        (LISTED_SINCE, "rating", "2024-04-01T00:00:00Z", False),
+        # Coverage unknown
+        (None, "relevance", None, False),
+        (None, "date", "2024-04-01T00:00:00Z", False),
+    ],
+)
+def test_covers(since, order, published_after, expected):
+    assert video_index._covers(since, order, published_after) is expected
+
+
+def test_no_coverage_uses_api(index):
+    video_index.index_videos([_item("a", "2024-05-01T00:00:00Z")])
+
+    assert video_index.search_own_videos("cat", 1, "date", "2024-04-01T00:00:00Z") is None
+
+
+def test_matches_alone_do_not_make_a_complete_result(index):
+    video_index.index_videos(
+        [_item("a", "2024-05-01T00:00:00Z"), _item("b", "2024-04-01T00:00:00Z")],
+        complete_since="2024-04-01T00:00:00Z",
+    )
+
+    # Two hits for max_results=1, but relevance ranks beyond the listing
+    assert video_index.search_own_videos("cat", 1, "relevance") is None
+
+
+def test_date_search_within_coverage_is_local(index):
+    video_index.index_videos(
+        [_item("a", "2024-05-01T00:00:00Z"), _item("b", LISTED_SINCE)],
+        complete_since=LISTED_SINCE,
+    )
+
+    hits = video_index.search_own_videos("cat", 10, "date", "2024-04-01T00:00:00Z")
+    assert [hit["video_id"] for hit in hits] == ["a"]
+    assert video_index.search_own_videos("cat", 10, "date", "2024-01-01T00:00:00Z") is None
+
+
+def test_fully_covered_channel_answers_empty(index):
+    video_index.index_videos([], complete_since="")
+
+    assert video_index.search_own_videos("dog", 10, "relevance") == []
+
+
+def test_query_without_words_uses_api(index):
+    video_index.index_videos([], complete_since="")
+
+    assert video_index.search_own_videos("  ", 10) is None
+
+
+def test_coverage_expires_with_the_listing(index, monkeypatch):
+    video_index.index_videos([_item("a", "2024-05-01T00:00:00Z")], complete_since="")
+    assert index.coverage("account") == ""
+
+    later = time.time() + video_index._COVERAGE_MAX_AGE + 1
+    monkeypatch.setattr(video_index.time, "time", lambda: later)
+
+    assert index.coverage("account") is None
+    assert video_index.search_own_videos("cat", 10) is None
+
+
+def test_coverage_is_per_account(index):
+    video_index.index_videos([], complete_since="")
+
+    assert index.coverage("other account") is None